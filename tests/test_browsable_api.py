@@ -1,3 +1,6 @@
+from unittest.mock import patch
+
+
 def test_browsable_api(client, db, profile, user):
     profile_url = f"/profiles/{profile.pk}/"
     response = client.get(profile_url, HTTP_ACCEPT="text/html,image/png")
@@ -17,3 +20,16 @@ def test_browsable_api(client, db, profile, user):
     assert client.get(profile_url, HTTP_ACCEPT="application/json").json()
     assert client.get(profile_url, HTTP_ACCEPT="text/plain").json()
     assert client.get(f"{profile_url}?format=json", HTTP_ACCEPT="text/html").json()
+
+
+def test_browsable_api_serializer_loads(client, db, profile):
+    payload = dict(phone="(555) 555-5555", boolean=True, integer=1)
+
+    with patch("worf.settings.WORF_DEBUG", True):
+        response = client.patch(
+            f"/profiles/{profile.pk}/", payload, HTTP_ACCEPT="text/html"
+        )
+
+    assert response.status_code == 200, response.content.decode("UTF-8")
+    assert response.context["serializer_loads"] == dict(hits=5, misses=1)
+    assert "Loaded 1, reused 5" in response.content.decode("UTF-8")
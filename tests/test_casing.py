@@ -1,6 +1,6 @@
 import pytest
 
-from worf.casing import camel_to_snake, snake_to_camel
+from worf.casing import cache_clear, cache_info, camel_to_snake, snake_to_camel
 from worf.exceptions import NamingThingsError
 
 
@@ -39,3 +39,38 @@ def test_camel_to_snake_catches_invalid_chars():
 def test_snake_to_camel_catches_invalid_chars():
     with pytest.raises(NamingThingsError):
         snake_to_camel("this_aint_no_🐍")
+
+
+def test_camel_to_snake_handles_lookups():
+    assert camel_to_snake("dateJoined__gte") == "date_joined__gte"
+
+
+def test_camel_to_snake_handles_unicode():
+    assert camel_to_snake("añoNuevo") == "año_nuevo"
+
+
+def test_snake_to_camel_handles_unicode():
+    assert snake_to_camel("año_nuevo") == "añoNuevo"
+
+
+def test_snake_to_camel_handles_double_underscores():
+    assert snake_to_camel("date_joined__gte") == "dateJoinedGte"
+
+
+def test_conversions_are_cached():
+    cache_clear()
+    camel_to_snake("cachedKey")
+    camel_to_snake("cachedKey")
+    snake_to_camel("cached_key")
+    info = cache_info()
+    assert info["camel_to_snake"].hits == 1
+    assert info["camel_to_snake"].misses == 1
+    assert info["snake_to_camel"].misses == 1
+
+
+def test_errors_are_not_cached():
+    cache_clear()
+    for _ in range(2):
+        with pytest.raises(NamingThingsError):
+            camel_to_snake("NotACamel")
+    assert cache_info()["camel_to_snake"].currsize == 0
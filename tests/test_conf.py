@@ -6,3 +6,5 @@ def test_settings():
     assert settings.WORF_API_ROOT == "/api/"
     assert settings.WORF_BROWSABLE_API is True
     assert settings.WORF_DEBUG is False
+    assert settings.WORF_JSON_BACKEND == "json"
+    assert settings.WORF_JSON_COMPACT is False
@@ -0,0 +1,69 @@
+from datetime import datetime, timezone
+from decimal import Decimal
+from unittest.mock import patch
+from uuid import UUID
+
+import pytest
+
+from django.core.exceptions import ImproperlyConfigured
+
+from tests import parametrize
+from worf.encoders import dumps, get_backend, loads
+
+data = dict(
+    datetime=datetime(2020, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+    datetime_ms=datetime(2020, 1, 2, 3, 4, 5, 123456, tzinfo=timezone.utc),
+    decimal=Decimal("1.50"),
+    list=[1, 2],
+    uuid=UUID("fd3d8e24-49e3-4d45-9a2e-05c2cd3fa6f4"),
+)
+expected = dict(
+    datetime="2020-01-02T03:04:05Z",
+    datetime_ms="2020-01-02T03:04:05.123Z",
+    decimal="1.50",
+    list=[1, 2],
+    uuid="fd3d8e24-49e3-4d45-9a2e-05c2cd3fa6f4",
+)
+
+
+def test_dumps():
+    assert dumps(dict(a=[1])) == b'{\n"a": [\n1\n]\n}'
+    assert dumps(dict(a=[1]), compact=True) == b'{"a":[1]}'
+    assert dumps(dict(a=[1]), indent=2) == b'{\n  "a": [\n    1\n  ]\n}'
+    assert loads(dumps(data)) == expected
+
+
+@parametrize("name", ["orjson", "ujson"])
+def test_dumps_backend(name):
+    pytest.importorskip(name)
+    backend = get_backend(name)
+    decimal = 1.5 if name == "ujson" else expected["decimal"]
+    assert backend.loads(backend.dumps(data)) == {**expected, "decimal": decimal}
+    assert backend.loads(backend.dumps(data, indent=2)) == backend.loads(
+        backend.dumps(data)
+    )
+
+
+@parametrize("name", ["nope", "orjson", "ujson"])
+def test_get_backend_improperly_configured(name):
+    try:
+        __import__(name)
+    except ImportError:
+        with pytest.raises(ImproperlyConfigured):
+            get_backend(name)
+    else:  # pragma: no cover
+        assert get_backend(name)
+
+
+def test_get_backend_follows_setting():
+    assert get_backend() is get_backend("json")
+    with patch("worf.settings.WORF_JSON_BACKEND", "nope"):
+        with pytest.raises(ImproperlyConfigured):
+            get_backend()
+
+
+def test_render_response_requires_dict(rf):
+    from worf.renderers import render_response
+
+    with pytest.raises(TypeError):
+        render_response(rf.get("/"), [1, 2], 200, None)
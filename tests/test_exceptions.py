@@ -9,6 +9,7 @@ from worf import exceptions
     dict(e=exceptions.FieldError("test")),
     dict(e=exceptions.NamingThingsError("test")),
     dict(e=exceptions.NotFound("test")),
+    dict(e=exceptions.ParseError("test")),
     dict(e=exceptions.WorfError("test")),
 )
 def test_exception(e):
@@ -0,0 +1,144 @@
+import pytest
+
+from django.core.exceptions import ValidationError
+
+from tests import parametrize
+from worf.filters import (
+    apply_filterset,
+    generate_filterset,
+    get_filter_data,
+    joins_many,
+)
+
+
+def test_joins_many(db):
+    from tests.models import Profile
+
+    queryset = Profile.objects.all()
+    assert not joins_many(queryset)
+    assert not joins_many(queryset.filter(user__username="test"))
+    assert not joins_many(queryset.filter(role__name="test", team__name="test"))
+    assert not joins_many(queryset.exclude(tags__name="test"))
+    assert joins_many(queryset.filter(tags__name="test"))
+    assert joins_many(queryset.filter(ratedskill__rating=5))
+
+
+def test_joins_many_reverse(db):
+    from tests.models import Role
+
+    assert joins_many(Role.objects.filter(profile__phone="test"))
+
+
+def test_generate_filterset_is_cached():
+    from tests.models import Profile
+    from tests.views import ProfileList
+
+    filter_set = generate_filterset(Profile, ProfileList.queryset)
+    assert filter_set is generate_filterset(Profile, ProfileList.queryset.all())
+    assert filter_set is not generate_filterset(Profile, Profile.objects.all())
+    assert generate_filterset(Profile, None) is generate_filterset(
+        Profile, Profile.objects.all()
+    )
+
+
+def test_filterset_filters_are_cached(db):
+    from tests.models import Profile
+    from tests.views import ProfileList
+
+    filter_set = generate_filterset(Profile, ProfileList.queryset)
+    filters = filter_set(queryset=ProfileList.queryset).filters
+    assert "name" in filters
+    assert filter_set(queryset=ProfileList.queryset.all()).filters is filters
+    assert "name" not in filter_set(queryset=Profile.objects.all()).filters
+    queryset = apply_filterset(filter_set, ProfileList.queryset, dict(name="a b"))
+    assert not queryset.exists()
+
+
+def test_filterset_filters_are_not_rebound(db):
+    from url_filter.constants import StrictMode
+
+    from tests.models import Profile
+
+    filter_set = generate_filterset(Profile, None)
+    queryset = Profile.objects.all()
+    data = get_filter_data({"tags__in": "1,x"})
+    strict = filter_set(data=data, queryset=queryset, strict_mode=StrictMode.fail)
+    lenient = filter_set(data=data, queryset=queryset, strict_mode=StrictMode.drop)
+    assert strict.filters is lenient.filters
+    assert strict.filters["tags"].root not in (strict, lenient)
+    assert len(lenient.get_specs()) == 1
+    with pytest.raises(ValidationError):
+        strict.get_specs()
+    assert len(lenient.get_specs()) == 1
+
+
+def test_filterset_annotation_signature():
+    from django import forms
+    from django.db.models import CharField, F, IntegerField, Value
+
+    from tests.models import Profile
+
+    texts = Profile.objects.annotate(level=Value("1", output_field=CharField()))
+    numbers = Profile.objects.annotate(level=Value(1, output_field=IntegerField()))
+    text_filters = generate_filterset(Profile, texts)(queryset=texts).filters
+    number_filters = generate_filterset(Profile, numbers)(queryset=numbers).filters
+    assert text_filters is not number_filters
+    assert type(text_filters["level"].form_field) is forms.CharField
+    assert type(number_filters["level"].form_field) is forms.IntegerField
+    same = Profile.objects.annotate(level=F("phone"))
+    assert generate_filterset(Profile, same) is generate_filterset(Profile, texts)
+
+
+@parametrize(
+    "lookup_kwargs",
+    [
+        {"tags__in": "1,2"},
+        {"tags!": 1},
+        {"name__icontains": "a", "not-a-key": "b"},
+        {"last_name": ["a", "b"]},
+    ],
+)
+def test_apply_filterset(db, lookup_kwargs):
+    from url_filter.filtersets.base import FilterSet
+
+    from tests.models import Profile
+    from tests.views import ProfileList
+
+    filter_set = generate_filterset(Profile, ProfileList.queryset)
+    data = get_filter_data(lookup_kwargs)
+    expected = FilterSet.get_specs(filter_set(data=data, queryset=ProfileList.queryset))
+    specs = filter_set(data=data, queryset=ProfileList.queryset).get_specs()
+    assert [vars(spec) for spec in specs] == [vars(spec) for spec in expected]
+
+
+@parametrize(
+    "lookup_kwargs",
+    [
+        {"integer__nope": "1"},
+        {"integer__in__exact": "1"},
+        {"integer": "nope"},
+    ],
+)
+def test_apply_filterset_invalid(db, lookup_kwargs):
+    from url_filter.constants import StrictMode
+
+    from tests.models import Profile
+
+    filter_set = generate_filterset(Profile, None)
+    queryset = Profile.objects.all()
+    assert apply_filterset(filter_set, queryset, lookup_kwargs).query.is_empty()
+    with pytest.raises(ValidationError):
+        data = get_filter_data(lookup_kwargs)
+        filter_set(data=data, queryset=queryset, strict_mode=StrictMode.fail).filter()
+
+
+def test_apply_filterset_unknown(db):
+    from tests.models import Profile
+
+    filter_set = generate_filterset(Profile, None)
+    queryset = Profile.objects.all()
+    assert (
+        apply_filterset(filter_set, queryset, {"nope": "1"}).query.where
+        == queryset.query.where
+    )
+    assert apply_filterset(filter_set, queryset, {"tags__nope": "1"}).query.is_empty()
@@ -0,0 +1,125 @@
+from django.db.models import F
+
+from tests import parametrize
+from tests.serializers import ProfileSerializer, UserSerializer
+from worf.optimizers import get_loaded_fields, get_relations, only_loaded_fields
+from worf.serializers import Serializer, fields
+
+
+def test_get_relations():
+    from tests.models import Profile
+
+    select_related, prefetch_related = get_relations(Profile, ProfileSerializer())
+    assert select_related == {"role", "team", "user"}
+    assert prefetch_related == {
+        "ratedskill_set",
+        "ratedskill_set__skill",
+        "tags",
+        "tasks",
+    }
+
+
+def test_get_relations_only():
+    from tests.models import Profile
+
+    serializer = ProfileSerializer(only=["id", "email", "tags"])
+    assert get_relations(Profile, serializer) == ({"user"}, {"tags"})
+
+
+def test_get_relations_reverse():
+    from django.contrib.auth.models import User
+
+    assert get_relations(User, UserSerializer()) == (set(), set())
+
+
+def test_get_loaded_fields():
+    from django.contrib.auth.models import User
+
+    assert get_loaded_fields(User, UserSerializer(), {}) == {
+        "date_joined",
+        "email",
+        "id",
+        "last_login",
+        "username",
+    }
+
+
+def test_get_loaded_fields_related():
+    from tests.models import Profile
+
+    serializer = ProfileSerializer(only=["id", "username", "role", "tags"])
+    assert get_loaded_fields(Profile, serializer, {}) == {"id", "role", "user"}
+    assert get_loaded_fields(Profile, serializer, {"role": {}, "user": {}}) == {
+        "id",
+        "role",
+        "role__id",
+        "role__name",
+        "user",
+        "user__username",
+    }
+
+
+@parametrize(
+    "field",
+    [
+        fields.Function(lambda user: user.username),
+        fields.String(attribute="name"),
+    ],
+)
+def test_get_loaded_fields_unresolvable(field):
+    from django.contrib.auth.models import User
+
+    serializer = Serializer.from_dict(dict(name=field))()
+    assert get_loaded_fields(User, serializer, {}) is None
+    assert get_loaded_fields(User, ProfileSerializer(), {}) is None
+
+
+def test_only_loaded_fields(db):
+    from tests.models import Profile
+
+    queryset = Profile.objects.annotate(name=F("user__first_name"))
+    serializer = ProfileSerializer(only=["id", "role"])
+    assert only_loaded_fields(
+        queryset.select_related(), serializer
+    ).query.deferred_loading == (frozenset(), True)
+    queryset = only_loaded_fields(
+        queryset.select_related("team"), serializer, ["name", "phone"]
+    )
+    assert queryset.query.deferred_loading == ({"id", "phone", "role", "team"}, False)
+    assert only_loaded_fields(queryset, serializer, ["nope"]) is queryset
+
+
+class LoopProfileSerializer(Serializer):
+    user = fields.Nested("LoopUserSerializer")
+
+    class Meta:
+        fields = ["id", "user"]
+
+
+class LoopUserSerializer(Serializer):
+    profile = fields.Nested(LoopProfileSerializer)
+
+    class Meta:
+        fields = ["id", "profile"]
+
+
+class SelfUserSerializer(Serializer):
+    me = fields.Nested("self", attribute="profile.user")
+
+    class Meta:
+        fields = ["id", "me"]
+
+
+def test_get_relations_cycles():
+    from django.contrib.auth.models import User
+
+    from tests.models import Profile
+
+    assert get_relations(Profile, LoopProfileSerializer()) == (
+        {"user", "user__profile"},
+        set(),
+    )
+    assert get_relations(User, SelfUserSerializer()) == (
+        {"profile", "profile__user"},
+        set(),
+    )
@@ -0,0 +1,59 @@
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from django.core.exceptions import ImproperlyConfigured
+
+from worf.pagination import CursorPaginator, CursorSerializer, cached_count
+
+
+def test_cursor_serializer():
+    uuid = uuid4()
+    data = CursorSerializer().dumps([Decimal("1.50"), uuid])
+    assert CursorSerializer().loads(data) == ["1.50", str(uuid)]
+    with pytest.raises(TypeError):
+        CursorSerializer().dumps([object()])
+
+
+def test_cursor_paginator_pages_by_uuid(db, profile_factory):
+    from tests.models import Profile
+
+    profiles = sorted(profile_factory.create_batch(3), key=lambda p: p.pk)
+    paginator = CursorPaginator(Profile.objects.all(), 2, ["id"])
+    page = paginator.page()
+    assert len(page) == 2
+    assert list(page) == profiles[:2]
+    page = paginator.page(page.next_cursor)
+    assert list(page) == profiles[2:]
+    assert page.next_cursor is None
+
+
+def test_cursor_paginator_empty_page(db):
+    from tests.models import Profile
+
+    page = CursorPaginator(Profile.objects.all(), 2, []).page()
+    assert len(page) == 0
+    assert page.next_cursor is None
+    assert page.previous_cursor is None
+
+
+def test_cursor_paginator_requires_field_ordering(db):
+    from tests.models import Profile
+
+    with pytest.raises(ImproperlyConfigured):
+        CursorPaginator(Profile.objects.all(), 2, ["?"])
+
+
+def test_cached_count_keys_by_params(db, user_factory):
+    from django.contrib.auth.models import User
+    from django.core.cache import cache
+
+    cache.clear()
+    user_factory.create(username="a")
+    user_factory.create(username="b")
+    # both render as `IN (a, b)` when the params are interpolated
+    single = User.objects.filter(username__in=["a, b"])
+    double = User.objects.filter(username__in=["a", "b"])
+    assert cached_count(single, type(single).count, 60) == 0
+    assert cached_count(double, type(double).count, 60) == 2
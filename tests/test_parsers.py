@@ -0,0 +1,43 @@
+from io import BytesIO
+from types import SimpleNamespace
+
+import pytest
+
+from django.core.exceptions import RequestDataTooBig
+
+from tests import parametrize
+from worf.exceptions import ParseError
+from worf.parsers import parse_json, read_body
+
+
+def fake_request(body, **meta):
+    return SimpleNamespace(META=meta, read=BytesIO(body).read)
+
+
+@parametrize("chunk_size", [1, 3, 1024])
+def test_read_body(chunk_size):
+    body = b'{"a": [1, 2]}'
+    assert read_body(fake_request(body), 13, chunk_size) == body
+    with pytest.raises(RequestDataTooBig):
+        read_body(fake_request(body), 12, chunk_size)
+    with pytest.raises(RequestDataTooBig):
+        read_body(fake_request(b"", CONTENT_LENGTH="13"), 12, chunk_size)
+
+
+@parametrize("body", [b"{", b'{"a": }', b"\xff"])
+def test_parse_json_invalid(body):
+    with pytest.raises(ParseError):
+        parse_json(fake_request(body))
+
+
+def test_parse_json():
+    assert parse_json(fake_request(b"")) == {}
+    assert parse_json(fake_request(b'{"a": [1, 2]}')) == dict(a=[1, 2])
+    assert parse_json(SimpleNamespace(_body=b"", body=b"")) == {}
+
+
+def test_parse_json_keeps_body(rf):
+    request = rf.post("/", b'{"a": 1}', content_type="application/json")
+    assert parse_json(request) == dict(a=1)
+    assert request.body == b'{"a": 1}'
+    assert parse_json(request) == dict(a=1)
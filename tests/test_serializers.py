@@ -34,3 +34,103 @@ def test_team_serializer():
 
 def test_user_serializer():
     assert f"{tests.serializers.UserSerializer()}"
+
+
+def test_bound_serializers_are_cached():
+    worf.serializers.cache_clear()
+    serializer = tests.serializers.UserSerializer.bound(only=["id", "email"])
+    other = tests.serializers.UserSerializer.bound(only=["email", "id"])
+    assert serializer is not other
+    assert serializer.fields.keys() == other.fields.keys()
+    assert serializer.fields["id"] is not other.fields["id"]
+    assert serializer.fields["id"].parent is serializer
+    tests.serializers.UserSerializer.bound(only=["email"])
+    assert worf.serializers.cache_info().hits == 1
+    assert worf.serializers.cache_info().misses == 2
+
+
+def test_bound_serializers_keep_their_context():
+    first = tests.serializers.ProfileSerializer.bound(context=dict(request=1))
+    second = tests.serializers.ProfileSerializer.bound(context=dict(request=2))
+    assert first is not second
+    assert first.context == dict(request=1)
+    assert first.fields["role"].schema.context == dict(request=1)
+    assert first.fields["skills"].schema.context == dict(request=1)
+    assert second.context == dict(request=2)
+    assert second.fields["role"].schema.context == dict(request=2)
+    assert second.fields["skills"].schema.context == dict(request=2)
+
+
+def test_bound_serializers_share_compiled_dump():
+    first = CompiledProfileSerializer.bound(context=dict(request=1))
+    second = CompiledProfileSerializer.bound(context=dict(request=2))
+    assert first.dump_builder is second.dump_builder
+    assert first.dump_plan is not second.dump_plan
+
+
+def test_called_serializers_are_cached():
+    serializer = tests.serializers.UserSerializer(only=["id", "email"])
+    worf.serializers.cache_clear()
+    serializer(only=["id"])
+    serializer(only=["id"])
+    assert worf.serializers.cache_info().hits == 1
+    assert serializer(only=["id"]).only == {"id"}
+
+
+class CompiledProfileSerializer(tests.serializers.ProfileSerializer):
+    class Meta(tests.serializers.ProfileSerializer.Meta):
+        compiled = True
+
+
+class CompiledUserSerializer(tests.serializers.UserSerializer):
+    is_active = worf.serializers.fields.Boolean()
+    last_name = worf.serializers.fields.String()
+    missing = worf.serializers.fields.Integer()
+    pk = worf.serializers.fields.Integer(as_string=True)
+
+    class Meta:
+        compiled = True
+        fields = [*tests.serializers.UserSerializer.Meta.fields, "is_active", "last_name", "missing", "pk"]  # fmt: skip
+
+
+def test_compiled_serializer_matches_marshmallow(db, now, profile_factory, tag):
+    from tests.factories import RatedSkillFactory
+
+    profile = profile_factory.create(
+        created_at=now(),
+        decimal="1.25",
+        integer=123,
+        json=dict(something=True),
+        last_active=now().date(),
+        start_time=now().time(),
+        tags=[tag],
+    )
+    RatedSkillFactory.create_batch(2, profile=profile)
+
+    serializer = tests.serializers.ProfileSerializer()
+    compiled = CompiledProfileSerializer()
+
+    assert compiled.dump(profile) == serializer.dump(profile)
+    assert compiled.dump([profile], many=True) == serializer.dump([profile], many=True)
+
+
+def test_compiled_serializer_matches_marshmallow_for_inline_fields(db, user):
+    serializer = CompiledUserSerializer()
+    dump = marshmallow.Schema._serialize
+
+    user.last_login = user.date_joined
+    assert serializer.dump(user) == dump(serializer, user)
+    assert serializer.dump(user)["missing"] is None
+    assert serializer.dump(user)["pk"] == str(user.pk)
+
+    data = dict(id=1, username="user", isActive=True)
+    assert serializer.dump(data) == dump(serializer, data)
+
+
+def test_compiled_serializer_recompiles_when_fields_change():
+    serializer = CompiledUserSerializer()
+    plan = serializer.dump_plan
+    assert serializer.dump_plan is plan
+    serializer.only = {"id"}
+    serializer._init_fields()
+    assert serializer.dump_plan is not plan
@@ -1,9 +1,15 @@
+from datetime import datetime, time, timezone
+from decimal import Decimal
+from unittest.mock import patch
 from uuid import uuid4
 
 import pytest
 
 from django.core.exceptions import ValidationError
 
+from tests import parametrize
+from worf.validators import parse_iso_date, parse_iso_datetime, parse_iso_time
+
 uuid = uuid4()
 email = "something@example.com"
 phone = "(555) 555-5555"
@@ -141,3 +147,105 @@ def test_validate_custom_field_passes(profile_view):
 def test_validate_custom_field_raises_error(profile_view):
     with pytest.raises(ValidationError):
         profile_view.validate_phone("invalid number")
+
+
+def test_validation_plan_is_compiled_once(profile_view):
+    from tests.views import ProfileDetail
+    from worf.validators import VALIDATION_PLANS
+
+    VALIDATION_PLANS.clear()
+    plan = profile_view.get_validation_plan()
+
+    assert list(VALIDATION_PLANS.values()) == [plan]
+    assert ProfileDetail().get_validation_plan() is plan
+    assert plan["integer"].coerce is ProfileDetail._validate_int
+    assert plan["json"].coerce is None
+    assert plan["email"].allow_null
+    assert plan["role_id"].field is plan["role"].field
+
+
+def test_validation_plan_per_annotation_signature(profile_view):
+    from django.db.models import F, Value
+
+    from tests.models import Profile
+    from tests.views import ProfileDetail
+
+    plan = profile_view.get_validation_plan()
+    queryset = Profile.objects.annotate(rank=Value(1), handle=F("user__username"))
+
+    with patch("tests.views.ProfileDetail.queryset", queryset):
+        annotated = profile_view.get_validation_plan()
+
+    assert annotated is not plan
+    assert "rank" not in plan
+    assert annotated["rank"].coerce is ProfileDetail._validate_int
+    assert profile_view.get_validation_plan() is plan
+
+
+def test_validate_bundles(profile_view):
+    bundles = [
+        dict(integer="1", boolean="true"),
+        dict(integer="one", boolean="maybe", recovery_phone=phone),
+        dict(integer=None, role=None, decimal="0.5"),
+    ]
+    keymaps = [{key: key for key in bundle} for bundle in bundles]
+
+    errors = profile_view.validate_bundles(bundles, keymaps)
+
+    assert bundles[0] == dict(integer=1, boolean=True)
+    assert bundles[2]["decimal"] == Decimal("0.5")
+    assert errors == {
+        1: dict(
+            integer="Field integer accepts an integer",
+            boolean="Field boolean accepts a boolean, got maybe, coerced to None",
+            recovery_phone="recovery_phone is not editable",
+        ),
+        2: dict(role="Invalid role"),
+    }
+
+
+@parametrize(
+    "value,expected",
+    [
+        ("2022-05-04", datetime(2022, 5, 4)),
+        ("2022-5-4", datetime(2022, 5, 4)),
+    ],
+)
+def test_parse_iso_date(value, expected):
+    assert parse_iso_date(value) == expected
+
+
+@parametrize(
+    "value,expected",
+    [
+        ("2022-05-04T10:30", datetime(2022, 5, 4, 10, 30)),
+        ("2022-05-04 10:30:15.5", datetime(2022, 5, 4, 10, 30, 15, 500000)),
+        ("2022-05-04T10:30:15Z", datetime(2022, 5, 4, 10, 30, 15, tzinfo=timezone.utc)),
+        (
+            "2022-05-04T10:30:15+01:00",
+            datetime(2022, 5, 4, 9, 30, 15, tzinfo=timezone.utc),
+        ),
+        (
+            "2022-05-04T10:30:15,5+0100",
+            datetime(2022, 5, 4, 9, 30, 15, 500000, tzinfo=timezone.utc),
+        ),
+        ("2022-5-4T10:30", datetime(2022, 5, 4, 10, 30)),
+        ("not a datetime", None),
+    ],
+)
+def test_parse_iso_datetime(value, expected):
+    assert parse_iso_datetime(value) == expected
+
+
+@parametrize(
+    "value,expected",
+    [
+        ("10:30", time(10, 30)),
+        ("10:30:15.123456", time(10, 30, 15, 123456)),
+        ("1:30", time(1, 30)),
+        ("10:30:15,5", time(10, 30, 15, 500000)),
+        ("not a time", None),
+    ],
+)
+def test_parse_iso_time(value, expected):
+    assert parse_iso_time(value) == expected
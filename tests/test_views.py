@@ -1,7 +1,12 @@
+import json
+import warnings
 from datetime import timedelta
-from unittest.mock import patch
+from unittest.mock import ANY, patch
 from uuid import uuid4
 
+import pytest
+
+from django.core.exceptions import ValidationError
 from django.core.files.uploadedfile import SimpleUploadedFile
 
 from tests import parametrize
@@ -15,6 +20,73 @@ def test_profile_detail(client, db, profile, user):
     assert result["username"] == user.username
 
 
+def test_profile_detail_head(client, db, profile):
+    response = client.head(f"/profiles/{profile.pk}/")
+    assert response.status_code == 200
+    assert client.options(f"/profiles/{profile.pk}/").status_code == 200
+    assert client.post(f"/profiles/{profile.pk}/").status_code == 405
+
+
+def test_view_config():
+    from tests.views import ProfileList, UserList
+    from worf.views.base import VIEWS
+
+    config = ProfileList().view_config
+
+    assert VIEWS[ProfileList] is config
+    assert ProfileList().view_config is config
+    assert config.codepath == "tests.views.ProfileList"
+    assert config.handlers == {"delete", "get", "head", "options", "post"}
+    assert config.filter_set.__name__ == "ProfileFilterSet"
+    assert UserList(per_page=5).view_config is not VIEWS[UserList]
+
+
+def test_view_config_warns_once():
+    from tests.views import ProfileBulk
+
+    class UnprotectedBulk(ProfileBulk):
+        permissions = []
+
+    with pytest.warns(UserWarning, match="POST method allowed on"):
+        UnprotectedBulk.as_view()
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        UnprotectedBulk()
+
+    with pytest.warns(UserWarning, match="POST method allowed on"):
+        view = UnprotectedBulk.as_view(bulk_max_items=1)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        for _ in range(2):
+            instance = view.view_class(**view.view_initkwargs)
+            assert instance.view_config is view.view_initkwargs["view_config"]
+            assert instance.bulk_max_items == 1
+
+
+def test_view_filter_set_on_instance(client, db, profile):
+    from tests.models import Profile
+    from tests.views import ProfileList
+    from worf.filters import generate_filterset
+
+    class EmptyFilterSet(generate_filterset(Profile, ProfileList.queryset)):
+        def filter(self):
+            return self.queryset.none()
+
+    def setup(self, *args, **kwargs):
+        super(ProfileList, self).setup(*args, **kwargs)
+        self.filter_set = EmptyFilterSet
+
+    with patch.object(ProfileList, "setup", setup):
+        response = client.get("/profiles/")
+
+    result = response.json()
+    assert response.status_code == 200, result
+    assert result["profiles"] == []
+    assert client.get("/profiles/").json()["profiles"]
+
+
 def test_profile_detail_trimmed(client, db, profile, user):
     response = client.get(f"/profiles/trimmed/{profile.pk}/")
     result = response.json()
@@ -50,6 +122,23 @@ def test_profile_list(client, db, profile, user):
     assert result["profiles"][0]["username"] == user.username
 
 
+def test_profile_list_queries(
+    client, db, django_assert_num_queries, profile_factory, tag, task, team, url
+):
+    for profile in profile_factory.create_batch(3, team=team):
+        profile.tags.add(tag)
+        profile.tasks.add(task)
+        RatedSkillFactory.create_batch(2, profile=profile)
+    # count, profiles, the included skills, rated skills, skills, tags and tasks
+    with django_assert_num_queries(7):
+        response = client.get(url("/profiles/", {"include": ["skills", "team"]}))
+    result = response.json()
+    assert response.status_code == 200, result
+    assert len(result["profiles"]) == 3
+    assert len(result["profiles"][0]["skills"]) == 2
+    assert result["profiles"][0]["team"]["name"] == team.name
+
+
 @parametrize("page", [-1, 0, 1, 2])
 def test_profile_list_pages(client, db, page):
     response = client.get("/profiles/", dict(page=page))
@@ -169,6 +258,314 @@ def test_profile_multipart_create(mock_save, client, db, role, user):
     assert result["user"]["username"] == user.username
 
 
+def test_profile_bulk_create(
+    client, db, django_assert_num_queries, role, skill, tag, task, user_factory
+):
+    users = user_factory.create_batch(3)
+    payload = [
+        dict(
+            role=role.pk,
+            user=user.pk,
+            skills=[dict(id=skill.pk, rating=4)],
+            tags=[tag.pk],
+            tasks=[str(task.custom_id)],
+        )
+        for user in users
+    ]
+    # unique users, 5 relations, 4 inserts in a savepoint, then 5 to fetch results
+    with django_assert_num_queries(17):
+        response = client.post("/profiles/bulk/", payload)
+    result = response.json()
+    assert response.status_code == 201, result
+    assert [item["username"] for item in result["profiles"]] == [
+        user.username for user in users
+    ]
+    for item in result["profiles"]:
+        assert item["role"]["name"] == role.name
+        assert item["skills"] == [dict(id=skill.pk, name=skill.name, rating=4)]
+        assert item["tags"] == [tag.name]
+        assert item["tasks"] == [task.name]
+
+
+def test_profile_bulk_create_invalid(client, db, role, skill, user_factory):
+    users = user_factory.create_batch(4)
+    payload = [
+        dict(role=role.pk, user=users[0].pk),
+        dict(role=role.pk, user=users[0].pk),
+        "profile",
+        dict(role=999, user=users[1].pk),
+        dict(role=role.pk, user=users[2].pk, tags=[999]),
+        dict(role=role.pk, user=users[3].pk, skills=[dict(id=skill.pk, rating="A")]),
+    ]
+    response = client.post("/profiles/bulk/", payload)
+    result = response.json()
+    assert response.status_code == 422, result
+    assert result == dict(
+        message="Invalid items",
+        errors=[
+            dict(index=1, message="Field user must be unique"),
+            dict(index=2, message="Invalid item, expected an object"),
+        ],
+    )
+    response = client.post("/profiles/bulk/", [payload[0], *payload[3:]])
+    result = response.json()
+    assert response.status_code == 422, result
+    assert result["errors"] == [
+        dict(index=1, message="Invalid role"),
+        dict(index=2, message="Invalid tags"),
+        dict(index=3, message="Invalid skills"),
+    ]
+    assert not client.get("/profiles/").json()["profiles"]
+
+
+def test_user_bulk_create_duplicates(client, db, user):
+    payload = [
+        dict(username="dup", email="one@example.com"),
+        dict(username="dup", email="two@example.com"),
+        dict(username=user.username, email="three@example.com"),
+    ]
+    response = client.post("/users/bulk/", payload)
+    result = response.json()
+    assert response.status_code == 422, result
+    assert result["errors"] == [
+        dict(index=1, message="Field username must be unique"),
+        dict(index=2, message="Field username must be unique"),
+    ]
+
+
+def test_user_bulk_create_validate_per_item(client, db, user):
+    from worf.assigns import AssignAttributes
+
+    def validate(self):
+        AssignAttributes.validate(self)
+        if self.bundle["username"] == "admin":
+            raise ValidationError("Field username is reserved")
+
+    payload = [
+        dict(username="admin", email="one@example.com"),
+        dict(username=user.username, email="two@example.com"),
+        dict(username="other", email="invalid"),
+    ]
+    with patch("tests.views.UserBulk.validate", validate), patch(
+        "tests.views.UserBulk.validate_per_item", True
+    ):
+        response = client.post("/users/bulk/", payload)
+    result = response.json()
+    assert response.status_code == 422, result
+    assert result["errors"] == [
+        dict(index=0, message="Field username is reserved"),
+        dict(index=1, message="Field username must be unique"),
+        dict(index=2, message="invalid is not a valid email address"),
+    ]
+
+
+def test_user_bulk_create_validate_bundle(client, db):
+    from worf.validators import ValidateFields
+
+    def validate_bundle(self, key):
+        ValidateFields.validate_bundle(self, key)
+        if key == "username":
+            self.bundle[key] = self.bundle[key].lower()
+
+    payload = [dict(username="One"), dict(username="TWO")]
+    with patch("tests.views.UserBulk.validate_bundle", validate_bundle):
+        response = client.post("/users/bulk/", payload)
+    result = response.json()
+    assert response.status_code == 201, result
+    assert [user["username"] for user in result["users"]] == ["one", "two"]
+
+
+def test_profile_bulk_create_unique_strings(client, db, profile, role, user_factory):
+    user = user_factory.create()
+    payload = [
+        dict(role=role.pk, user=str(profile.user.pk)),
+        dict(role=role.pk, user=user.pk),
+        dict(role=role.pk, user=str(user.pk)),
+    ]
+    response = client.post("/profiles/bulk/", payload)
+    result = response.json()
+    assert response.status_code == 422, result
+    assert result["errors"] == [
+        dict(index=0, message="Field user must be unique"),
+        dict(index=2, message="Field user must be unique"),
+    ]
+
+
+def test_profile_bulk_annotation_keys(db, profile):
+    from tests.views import ProfileBulk
+    from worf.views.bulk import BulkItem
+
+    view = ProfileBulk()
+    item = BulkItem(0, profile, dict(first_name="Name"), dict(first_name="firstName"))
+    assert view.check_unique([item]) == []
+    assert view.resolve_bulk_relations([item]) == {}
+    view.assign_bundle(item, {})
+    assert item.fields == set()
+
+
+def test_profile_bulk_create_one(client, db, role, user):
+    response = client.post("/profiles/bulk/", dict(role=role.pk, user=user.pk))
+    result = response.json()
+    assert response.status_code == 201, result
+    assert result["username"] == user.username
+
+
+def test_profile_bulk_create_max_items(client, db, role, user):
+    with patch("tests.views.ProfileBulk.bulk_max_items", 1):
+        response = client.post(
+            "/profiles/bulk/", [dict(role=role.pk, user=user.pk)] * 2
+        )
+    result = response.json()
+    assert response.status_code == 422, result
+    assert result["message"] == "Bulk requests accept a maximum of 1 items"
+
+
+def test_profile_bulk_update(
+    client, db, django_assert_num_queries, profile_factory, skill, tag, team
+):
+    profiles = profile_factory.create_batch(3, phone="(555) 555-5555")
+    profiles[2].tags.add(tag)
+    payload = [
+        dict(id=str(profiles[0].pk), phone="(555) 555-0000", team=team.pk),
+        dict(id=str(profiles[1].pk), phone="(555) 555-5555"),
+        dict(id=str(profiles[2].pk), skills=[dict(id=skill.pk, rating=4)], tags=[]),
+    ]
+    # instances, team, skill, an update, 2 through reads, a delete and an insert in
+    # a savepoint, results
+    with django_assert_num_queries(15):
+        response = client.patch("/profiles/bulk/", payload)
+    result = response.json()
+    assert response.status_code == 200, result
+    assert [item["id"] for item in result["profiles"]] == [
+        str(profile.pk) for profile in profiles
+    ]
+    assert result["profiles"][0]["phone"] == "(555) 555-0000"
+    assert result["profiles"][0]["team"]["name"] == team.name
+    assert result["profiles"][1]["phone"] == "(555) 555-5555"
+    assert result["profiles"][2]["skills"] == [
+        dict(id=skill.pk, name=skill.name, rating=4)
+    ]
+    assert result["profiles"][2]["tags"] == []
+
+
+def test_profile_bulk_update_duplicate_lookups(client, db, user):
+    payload = [dict(id=user.pk, email="one@example.com"), dict(id=str(user.pk))]
+    response = client.patch("/users/bulk/", payload)
+    result = response.json()
+    assert response.status_code == 422, result
+    assert result["errors"] == [dict(index=1, message="Duplicate id")]
+
+
+def test_profile_bulk_update_m2m_diff(
+    client, db, django_assert_num_queries, profile, skill, skill_factory, tag
+):
+    profile.tags.add(tag)
+    RatedSkillFactory(profile=profile, skill=skill, rating=2)
+    other = skill_factory.create()
+    rows = list(profile.ratedskill_set.values_list("pk", flat=True))
+    skills = [dict(id=skill.pk, rating=3), dict(id=other.pk, rating=1)]
+    payload = [dict(id=str(profile.pk), skills=skills, tags=[tag.pk])]
+    # instances, skills, tags, 2 through reads, an insert and an update, results
+    with django_assert_num_queries(14) as captured:
+        response = client.patch("/profiles/bulk/", payload)
+    result = response.json()
+    assert response.status_code == 200, result
+    assert not any(query["sql"].startswith("DELETE") for query in captured)
+    assert profile.ratedskill_set.filter(pk__in=rows, rating=3).exists()
+    assert set(profile.ratedskill_set.values_list("skill", "rating")) == {
+        (skill.pk, 3),
+        (other.pk, 1),
+    }
+
+
+def test_profile_bulk_update_invalid(client, db, profile_factory):
+    profiles = profile_factory.create_batch(2, email=None)
+    profiles[1].email = "taken@example.com"
+    profiles[1].save()
+    payload = [
+        dict(phone="(555) 555-5555"),
+        dict(id=str(uuid4()), phone="(555) 555-5555"),
+        dict(id=str(profiles[0].pk), email="taken@example.com"),
+        dict(id=str(profiles[0].pk), phone="(555) 555-5555"),
+        dict(id=str(profiles[1].pk), phone=5, boolean="maybe"),
+    ]
+    response = client.patch("/profiles/bulk/", payload)
+    result = response.json()
+    assert response.status_code == 422, result
+    assert result["errors"] == [
+        dict(index=0, message="Invalid id"),
+        dict(index=1, message="Invalid id"),
+        dict(index=2, message="Field email must be unique"),
+        dict(index=3, message="Duplicate id"),
+        dict(index=4, message="Field phone accepts string"),
+        dict(
+            index=4,
+            message="Field boolean accepts a boolean, got maybe, coerced to None",
+        ),
+    ]
+
+
+def test_profile_bulk_update_object(client, db, profile):
+    response = client.patch("/profiles/bulk/", dict(id=str(profile.pk)))
+    result = response.json()
+    assert response.status_code == 400, result
+    assert result["message"] == "Invalid JSON, expected an array"
+
+
+@parametrize("dry_run", [True, False])
+def test_profile_bulk_delete(client, db, dry_run, profile_factory, tag, url):
+    profiles = profile_factory.create_batch(3)
+    profile_factory.create_batch(2)
+    for profile in profiles:
+        profile.tags.add(tag)
+    with patch("tests.views.ProfileList.bulk_batch_size", 2):
+        response = client.delete(url("/profiles/", dict(tags=tag.pk, dryRun=dry_run)))
+    result = response.json()
+    assert response.status_code == 200, result
+    assert result == dict(count=3)
+    remaining = client.get("/profiles/").json()["profiles"]
+    assert len(remaining) == (5 if dry_run else 2)
+
+
+def test_profile_bulk_delete_unfiltered(client, db, profile):
+    response = client.delete("/profiles/")
+    result = response.json()
+    assert response.status_code == 400, result
+    assert result["message"] == "Bulk delete requires a filter"
+
+
+@parametrize("filters", [dict(nope=1), dict(tags="nope"), dict(tags__in="1,nope")])
+def test_profile_bulk_delete_invalid_filter(client, db, filters, profile, url):
+    from tests.views import ProfileList
+
+    # keys without a filter are dropped by the filterset, deleting everything
+    filter_fields = [*ProfileList.filter_fields, "nope"]
+    with patch.object(ProfileList, "filter_fields", filter_fields):
+        response = client.delete(url("/profiles/", filters))
+    result = response.json()
+    assert response.status_code == 400, result
+    assert result["message"] == f"Invalid filters: {set(filters)}"
+    assert len(client.get("/profiles/").json()["profiles"]) == 1
+
+
+def test_profile_bulk_delete_max_items(client, db, profile_factory, tag, url):
+    for profile in profile_factory.create_batch(2):
+        profile.tags.add(tag)
+    with patch("tests.views.ProfileList.bulk_max_items", 1):
+        response = client.delete(url("/profiles/", dict(tags=tag.pk)))
+    result = response.json()
+    assert response.status_code == 422, result
+    assert result["message"] == "Bulk delete matches more than 1 items"
+    assert len(client.get("/profiles/").json()["profiles"]) == 2
+
+
+def test_profile_update_list(client, db, profile):
+    response = client.patch(f"/profiles/{profile.pk}/", [dict(phone="555")])
+    result = response.json()
+    assert response.status_code == 400, result
+    assert result["message"] == "Invalid JSON, expected an object"
+
+
 @patch("django.core.files.storage.FileSystemStorage.save")
 @parametrize("method", ["PATCH", "PUT"])
 def test_profile_multipart_update(mock_save, client, db, method, profile, role, user):
@@ -274,6 +671,107 @@ def test_profile_update_m2m_through(client, db, method, profile, skill):
     assert result["skills"][0]["rating"] == 4
 
 
+def test_profile_update_m2m_diff(
+    client, db, django_assert_num_queries, profile, tag_factory, task_factory
+):
+    tags = tag_factory.create_batch(3)
+    tasks = task_factory.create_batch(2)
+    profile.tags.add(*tags[:2])
+    profile.tasks.add(*tasks)
+    payload = dict(
+        tags=[tags[1].pk, tags[2].pk],
+        tasks=[str(task.custom_id) for task in tasks],
+    )
+    # the profile, its update, current tags, a delete and an insert in a savepoint,
+    # tasks and current tasks, then the refresh, 4 prefetched relations, the user
+    # and role instances, skills, tags, 2 through reads, an insert and an update
+    with django_assert_num_queries(15) as captured:
+        response = client.patch(f"/profiles/{profile.pk}/", payload)
+    result = response.json()
+    assert response.status_code == 200, result
+    assert sorted(result["tags"]) == sorted(tag.name for tag in tags[1:])
+    assert sorted(result["tasks"]) == sorted(task.name for task in tasks)
+    writes = [q["sql"] for q in captured if q["sql"].startswith(("DELETE", "INSERT"))]
+    assert len(writes) == 2
+    assert f"IN ({tags[0].pk})" in writes[0]
+    assert f", {tags[2].pk})" in writes[1]
+    assert any(q["sql"].startswith('SELECT "tests_task"."id" FROM') for q in captured)
+
+
+def test_profile_update_m2m_through_prefetched(db, profile, skill_factory):
+    from tests.models import Profile
+    from tests.views import ProfileDetail
+
+    skills = skill_factory.create_batch(2)
+    RatedSkillFactory.create(profile=profile, skill=skills[0], rating=1)
+    profile = Profile.objects.prefetch_related("ratedskill_set", "skills").get()
+    view = ProfileDetail()
+    view.keymap = dict(skills="skills")
+    view.relations = dict(skills={skill.pk: skill for skill in skills})
+    value = [dict(id=skills[1].pk, rating=4)]
+    view.set_many_to_many_with_through(profile, "skills", value)
+    assert list(profile.skills.all()) == [skills[1]]
+    assert [row.skill for row in profile.ratedskill_set.all()] == [skills[1]]
+
+
+def test_profile_update_m2m_through_save(client, db, profile, skill_factory):
+    from tests.models import RatedSkill
+
+    skills = skill_factory.create_batch(2)
+    RatedSkillFactory.create(profile=profile, skill=skills[0], rating=1)
+    payload = dict(skills=[dict(id=skill.pk, rating=4) for skill in skills])
+    with patch.object(RatedSkill, "save", autospec=True) as save:
+        response = client.patch(f"/profiles/{profile.pk}/", payload)
+    assert response.status_code == 200, response.json()
+    assert sorted(call.args[0].skill_id for call in save.call_args_list) == sorted(
+        skill.pk for skill in skills
+    )
+
+
+def test_profile_update_prefetched_queryset(client, db, profile, skill_factory):
+    from tests.models import Profile
+
+    skills = skill_factory.create_batch(2)
+    RatedSkillFactory.create(profile=profile, skill=skills[0], rating=1)
+    payload = dict(skills=[dict(id=skills[1].pk, rating=4)])
+    queryset = Profile.objects.prefetch_related("ratedskill_set", "skills")
+    with patch("tests.views.ProfileDetail.queryset", queryset), patch(
+        "tests.views.ProfileDetail.refresh_fields", ["phone"]
+    ):
+        response = client.patch(f"/profiles/{profile.pk}/", payload)
+    result = response.json()
+    assert response.status_code == 200, result
+    assert [(skill["id"], skill["rating"]) for skill in result["skills"]] == [
+        (skills[1].pk, 4)
+    ]
+
+
+def test_profile_update_m2m_through_queries(
+    client, db, django_assert_num_queries, profile, skill_factory
+):
+    skills = skill_factory.create_batch(20)
+    RatedSkillFactory.create_batch(2, profile=profile)
+    RatedSkillFactory.create(profile=profile, skill=skills[0], rating=1)
+    payload = dict(skills=[dict(id=skill.pk, rating=4) for skill in skills])
+    # the profile, its update, skills and rated skills, a delete, an insert and an
+    # update in a savepoint, then the refresh, 4 prefetched relations, the user and
+    # the role
+    with django_assert_num_queries(16):
+        response = client.patch(f"/profiles/{profile.pk}/", payload)
+    result = response.json()
+    assert response.status_code == 200, result
+    assert {skill["id"] for skill in result["skills"]} == {skill.pk for skill in skills}
+    assert {skill["rating"] for skill in result["skills"]} == {4}
+
+
+def test_profile_update_m2m_through_invalid(client, db, profile, skill):
+    payload = dict(skills=[dict(id=skill.pk, level=4)])
+    response = client.patch(f"/profiles/{profile.pk}/", payload)
+    result = response.json()
+    assert response.status_code == 422, result
+    assert result["message"] == "Invalid skills"
+
+
 @parametrize("method", ["PATCH", "PUT"])
 def test_profile_update_m2m_through_can_be_empty(client, db, method, profile, skill):
     response = client.generic(method, f"/profiles/{profile.pk}/", dict(skills=[]))
@@ -521,3 +1019,288 @@ def test_user_update(client, db, method, user):
     assert response.status_code == 200, result
     assert result["username"] == "testtest"
     assert result["email"] == "something@example.com"
+
+
+def test_user_list_cursor_pagination(client, db, url, user_factory):
+    users = user_factory.create_batch(5)
+    response = client.get("/users/cursor/")
+    result = response.json()
+    assert response.status_code == 200, result
+    assert [user["id"] for user in result["users"]] == [u.pk for u in users[:2]]
+    assert result["pagination"]["previous"] is None
+
+    response = client.get(
+        url("/users/cursor/", {"cursor": result["pagination"]["next"]})
+    )
+    result = response.json()
+    assert [user["id"] for user in result["users"]] == [u.pk for u in users[2:4]]
+
+    response = client.get(
+        url("/users/cursor/", {"cursor": result["pagination"]["next"]})
+    )
+    result = response.json()
+    assert [user["id"] for user in result["users"]] == [users[4].pk]
+    assert result["pagination"]["next"] is None
+
+    previous = result["pagination"]["previous"]
+    response = client.get(url("/users/cursor/", {"cursor": previous}))
+    result = response.json()
+    assert [user["id"] for user in result["users"]] == [u.pk for u in users[2:4]]
+
+    previous = result["pagination"]["previous"]
+    response = client.get(url("/users/cursor/", {"cursor": previous}))
+    result = response.json()
+    assert [user["id"] for user in result["users"]] == [u.pk for u in users[:2]]
+    assert result["pagination"]["previous"] is None
+    assert result["pagination"]["next"]
+
+
+def test_user_list_cursor_pagination_sort(client, db, now, url, user_factory):
+    date_joined = now()
+    a = user_factory.create(date_joined=date_joined)
+    b = user_factory.create(date_joined=date_joined - timedelta(hours=1))
+    c = user_factory.create(date_joined=date_joined)
+    results = []
+    params = {"sort": "-dateJoined"}
+    while True:
+        response = client.get(url("/users/cursor/", params))
+        result = response.json()
+        assert response.status_code == 200, result
+        results += [user["id"] for user in result["users"]]
+        if not result["pagination"]["next"]:
+            break
+        params["cursor"] = result["pagination"]["next"]
+    assert results == [a.pk, c.pk, b.pk]
+
+
+def test_user_list_cursor_pagination_invalid_cursor(client, db, url):
+    response = client.get(url("/users/cursor/", {"cursor": "invalid"}))
+    result = response.json()
+    assert response.status_code == 400, result
+    assert result["message"] == "Invalid cursor"
+
+
+@parametrize("count", ["estimate", "false", "true"])
+def test_user_list_count(client, db, url, user_factory, count):
+    user_factory.create_batch(3)
+    response = client.get(url("/users/", {"count": count, "page": 2, "perPage": 2}))
+    result = response.json()
+    assert response.status_code == 200, result
+    assert len(result["users"]) == 1
+    if count == "false":
+        assert result["pagination"] == dict(page=2)
+    else:
+        assert result["pagination"] == dict(count=3, pages=2, page=2)
+
+
+def test_user_list_count_invalid(client, db, url):
+    response = client.get(url("/users/", {"count": "sometimes"}))
+    result = response.json()
+    assert response.status_code == 400, result
+    assert result["message"] == "Invalid count: sometimes"
+
+
+def test_user_list_estimated_count(client, db, url, user_factory):
+    from django.core.cache import cache
+
+    cache.clear()
+    user_factory.create()
+    response = client.get(url("/users/estimated-count/", {"count": "exact"}))
+    result = response.json()
+    assert response.status_code == 200, result
+    assert result["pagination"] == dict(count=1, pages=1, page=1)
+
+    user_factory.create_batch(3)
+    response = client.get(url("/users/estimated-count/", {"page": 2}))
+    result = response.json()
+    assert response.status_code == 200, result
+    assert len(result["users"]) == 2
+    assert result["pagination"] == dict(count=1, pages=1, page=2)
+
+    # past the limit there's no estimate off PostgreSQL, so no count
+    cache.clear()
+    response = client.get(url("/users/estimated-count/", {"page": 2}))
+    result = response.json()
+    assert response.status_code == 200, result
+    assert len(result["users"]) == 2
+    assert result["pagination"] == dict(page=2)
+
+
+@parametrize("export_chunk_size", [1, 2, 1000])
+def test_profile_list_export_ndjson(client, db, profile_factory, export_chunk_size):
+    from tests.views import ProfileList
+
+    profiles = sorted(profile_factory.create_batch(3), key=lambda p: p.pk)
+    with patch.object(ProfileList, "export_chunk_size", export_chunk_size):
+        response = client.get("/profiles/", dict(format="ndjson"))
+        content = b"".join(response.streaming_content).decode()
+    assert response.status_code == 200
+    assert response["Content-Type"] == "application/x-ndjson"
+    rows = [json.loads(line) for line in content.splitlines()]
+    assert [row["id"] for row in rows] == [str(p.pk) for p in profiles]
+
+
+@parametrize("version,queries", [((4, 0), 7), ((4, 1), 5)])
+def test_profile_list_export_prefetches(
+    client, db, django_assert_num_queries, profile_factory, queries, tag, version
+):
+    from tests.views import ProfileList
+
+    profiles = sorted(profile_factory.create_batch(4, tags=[tag]), key=lambda p: p.pk)
+    with patch("django.VERSION", version):
+        with patch.object(ProfileList, "export_chunk_size", 2):
+            # 2 prefetches per chunk, read in 3 keyset queries (the last one empty)
+            # or with a single iterator query
+            with django_assert_num_queries(queries) as captured:
+                response = client.get("/profiles/", dict(format="ndjson"))
+                content = b"".join(response.streaming_content).decode()
+    rows = [json.loads(line) for line in content.splitlines()]
+    assert [row["id"] for row in rows] == [str(p.pk) for p in profiles]
+    assert all(row["tags"] == [tag.name] for row in rows)
+    assert not any("OFFSET" in q["sql"] for q in captured)
+
+
+@parametrize("version", [(4, 0), (4, 1)])
+def test_profile_list_export_non_unique_ordering(client, db, profile_factory, version):
+    from tests.views import ProfileList
+
+    profiles = profile_factory.create_batch(5, phone="(555) 555-5555")
+    with patch("django.VERSION", version), patch.object(
+        ProfileList, "export_chunk_size", 2
+    ), patch.object(ProfileList, "ordering", ["phone"]):
+        response = client.get("/profiles/", dict(format="ndjson"))
+        content = b"".join(response.streaming_content).decode()
+    rows = [json.loads(line) for line in content.splitlines()]
+    assert sorted(row["id"] for row in rows) == sorted(str(p.pk) for p in profiles)
+
+
+def test_profile_list_export_json_stream(client, db, profile_factory, url, user):
+    profile_factory.create_batch(2)
+    profile = profile_factory.create(user=user)
+    response = client.get(
+        url("/profiles/", {"format": "json-stream", "name": user.name})
+    )
+    result = json.loads(b"".join(response.streaming_content))
+    assert response.status_code == 200
+    assert response["Content-Type"] == "application/json"
+    assert [row["id"] for row in result["profiles"]] == [str(profile.pk)]
+
+
+def test_profile_list_export_empty(client, db):
+    response = client.get("/profiles/", dict(format="json-stream"))
+    assert json.loads(b"".join(response.streaming_content)) == dict(profiles=[])
+
+
+def test_profile_list_export_invalid_fields(client, db, url):
+    response = client.get(url("/profiles/", {"format": "ndjson", "fields": ["nope"]}))
+    result = response.json()
+    assert response.status_code == 400, result
+
+
+def test_user_list_only_loads_serialized_fields(
+    client, db, django_assert_num_queries, url, user
+):
+    with django_assert_num_queries(2) as captured:
+        response = client.get(url("/users/", {"fields": ["id", "username"]}))
+    result = response.json()
+    assert response.status_code == 200, result
+    assert result["users"] == [dict(id=user.pk, username=user.username)]
+    sql = captured.captured_queries[-1]["sql"]
+    assert '"auth_user"."username"' in sql
+    assert '"auth_user"."email"' not in sql
+
+
+def test_user_detail_only_loads_serialized_fields(
+    client, db, django_assert_num_queries, user
+):
+    with django_assert_num_queries(1) as captured:
+        response = client.get(f"/users/{user.pk}/")
+    result = response.json()
+    assert response.status_code == 200, result
+    assert result["email"] == user.email
+    assert '"auth_user"."password"' not in captured.captured_queries[0]["sql"]
+
+
+@parametrize("method", ["PATCH", "PUT"])
+def test_profile_update_invalid_json(client, db, method, profile):
+    response = client.generic(method, f"/profiles/{profile.pk}/", '{"phone": ')
+    result = response.json()
+    assert response.status_code == 400, result
+    assert result["message"] == "Invalid JSON"
+
+
+@parametrize("method", ["PATCH", "PUT"])
+def test_profile_update_too_big(client, db, method, profile):
+    payload = dict(phone="(555) 555-5555", recovery_phone="(555) 555-5555")
+    with patch("worf.settings.DATA_UPLOAD_MAX_MEMORY_SIZE", 32):
+        response = client.generic(method, f"/profiles/{profile.pk}/", payload)
+    result = response.json()
+    assert response.status_code == 422, result
+    assert result["message"] == "Max upload size is 32\xa0bytes"
+
+
+@parametrize(
+    "refresh_fields,expected",
+    [
+        (None, ["email", "id", "last_login", "username"]),
+        ([], None),
+        (["email", "password"], ["email"]),
+    ],
+)
+def test_user_update_refresh_fields(client, db, expected, refresh_fields, user):
+    with patch("tests.views.UserDetail.refresh_fields", refresh_fields), patch(
+        "django.contrib.auth.models.User.refresh_from_db", autospec=True
+    ) as refresh_from_db:
+        response = client.patch(f"/users/{user.pk}/", dict(email="new@example.com"))
+    result = response.json()
+    assert response.status_code == 200, result
+    assert result["email"] == "new@example.com"
+    if expected is None:
+        refresh_from_db.assert_not_called()
+    else:
+        refresh_from_db.assert_called_once_with(ANY, fields=expected)
+
+
+@parametrize("save_changed_fields", [True, False])
+def test_profile_update_changed_fields(
+    client, db, django_assert_num_queries, profile, save_changed_fields
+):
+    payload = dict(phone="(555) 555-5555", slug=profile.slug)
+    with patch("tests.views.ProfileDetail.save_changed_fields", save_changed_fields):
+        with django_assert_num_queries(8) as captured:
+            response = client.patch(f"/profiles/{profile.pk}/", payload)
+    result = response.json()
+    assert response.status_code == 200, result
+    assert result["phone"] == "+5555555555"
+    sql = next(q["sql"] for q in captured if q["sql"].startswith("UPDATE"))
+    assert ('"phone"' in sql, '"slug"' in sql) == (True, not save_changed_fields)
+
+
+@parametrize("save_changed_fields", [True, False])
+def test_profile_update_derived_fields(client, db, profile, save_changed_fields):
+    def save(self, *args, **kwargs):
+        self.slug = self.phone[-4:]
+        super(Profile, self).save(*args, **kwargs)
+
+    from tests.models import Profile
+
+    slug = profile.slug
+    payload = dict(phone="(555) 555-5555")
+    with patch("tests.views.ProfileDetail.save_changed_fields", save_changed_fields):
+        with patch.object(Profile, "save", save):
+            response = client.patch(f"/profiles/{profile.pk}/", payload)
+    assert response.status_code == 200, response.json()
+    profile.refresh_from_db()
+    assert profile.phone == "+5555555555"
+    # derived fields aren't part of update_fields unless save() adds them
+    assert profile.slug == (slug if save_changed_fields else "5555")
+
+
+@patch("tests.views.ProfileDetail.save_changed_fields", True)
+def test_profile_update_unchanged(client, db, django_assert_num_queries, profile):
+    payload = dict(slug=profile.slug)
+    # the profile, its refresh and the response's relations, no update
+    with django_assert_num_queries(7) as captured:
+        response = client.patch(f"/profiles/{profile.pk}/", payload)
+    assert response.status_code == 200, response.json()
+    assert not any(q["sql"].startswith("UPDATE") for q in captured)
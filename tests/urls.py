@@ -4,6 +4,7 @@ from tests import views
 
 urlpatterns = [
     path("profiles/", views.ProfileList.as_view()),
+    path("profiles/bulk/", views.ProfileBulk.as_view()),
     path("profiles/<uuid:id>/", views.ProfileDetail.as_view()),
     path("profiles/trimmed/<uuid:id>/", views.ProfileDetailTrimmed.as_view()),
     path("profiles/no-id/<uuid:id>/", views.ProfileDetailNoID.as_view()),
@@ -11,5 +12,8 @@ urlpatterns = [
     path("staff/<uuid:id>/", views.StaffDetail.as_view()),
     path("user/", views.UserSelf.as_view()),
     path("users/", views.UserList.as_view()),
+    path("users/bulk/", views.UserBulk.as_view()),
+    path("users/cursor/", views.UserCursorList.as_view()),
+    path("users/estimated-count/", views.UserEstimatedCountList.as_view()),
     path("users/<int:id>/", views.UserDetail.as_view()),
 ]
@@ -7,10 +7,21 @@ from tests.models import Profile
 from tests.serializers import ProfileSerializer, UserSerializer
 from worf.exceptions import AuthenticationError
 from worf.permissions import Authenticated, PublicEndpoint, Staff
-from worf.views import ActionAPI, CreateAPI, DeleteAPI, DetailAPI, ListAPI, UpdateAPI
-
-
-class ProfileList(CreateAPI, ListAPI):
+from worf.views import (
+    ActionAPI,
+    BulkCreateAPI,
+    BulkDeleteAPI,
+    BulkUpdateAPI,
+    CreateAPI,
+    DeleteAPI,
+    DetailAPI,
+    ExportAPI,
+    ListAPI,
+    UpdateAPI,
+)
+
+
+class ProfileList(BulkDeleteAPI, ExportAPI, CreateAPI, ListAPI):
     model = Profile
     queryset = Profile.objects.annotate(
         first_name=F("user__first_name"),
@@ -39,6 +50,12 @@ class ProfileList(CreateAPI, ListAPI):
     }
 
 
+class ProfileBulk(BulkUpdateAPI, BulkCreateAPI):
+    model = Profile
+    serializer = ProfileSerializer
+    permissions = [PublicEndpoint]
+
+
 class ProfileDetail(ActionAPI, DeleteAPI, UpdateAPI, DetailAPI):
     model = Profile
     serializer = ProfileSerializer
@@ -110,6 +127,12 @@ class UserList(CreateAPI, ListAPI):
     ]
 
 
+class UserBulk(BulkUpdateAPI, BulkCreateAPI):
+    model = User
+    serializer = UserSerializer
+    permissions = [PublicEndpoint]
+
+
 class UserDetail(UpdateAPI, DetailAPI):
     model = User
     serializer = UserSerializer(exclude=["date_joined"])
@@ -125,3 +148,15 @@ class UserSelf(DetailAPI):
         if not self.request.user.is_authenticated:
             raise AuthenticationError("Log in with your username and password")
         return self.request.user
+
+
+class UserCursorList(UserList):
+    cursor_pagination = True
+    per_page = 2
+
+
+class UserEstimatedCountList(UserList):
+    count_cache_timeout = 60
+    count_limit = 2
+    count_mode = "estimate"
+    per_page = 2
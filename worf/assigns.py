@@ -1,13 +1,21 @@
-from django.core.exceptions import ValidationError
-from django.db import models
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db import models, transaction
 from django.db.utils import IntegrityError
 
 
 class AssignAttributes:
+    save_changed_fields = False
+
     def save(self, instance, bundle):
         items = [
             (key, getattr(self.model, key), value) for key, value in bundle.items()
         ]
+        loaded = {
+            attr.field: getattr(instance, attr.field.attname)
+            for _, attr, _ in items
+            if not isinstance(attr.field, models.ManyToManyField)
+        }
+        self.relations = self.resolve_bundle_relations(items)
 
         for key, attr, value in items:
             if isinstance(value, models.Model):
@@ -23,75 +31,238 @@ class AssignAttributes:
 
             setattr(instance, key, value)
 
-        instance.save()
+        self.save_instance(instance, loaded)
 
         for key, attr, value in items:
             if isinstance(attr.field, models.ManyToManyField):
-                has_through = not attr.through._meta.auto_created
-
-                if has_through and any(isinstance(item, dict) for item in value):
+                if has_through(attr) and any(isinstance(item, dict) for item in value):
                     self.set_many_to_many_with_through(instance, key, value)
                     continue
 
                 self.set_many_to_many(instance, key, value)
 
-    def resolve_relation(self, key, value):
+    def save_instance(self, instance, loaded):
+        """Save the fields that differ from their `loaded` values, if any do."""
+        if instance._state.adding or not self.save_changed_fields:
+            instance.save()
+            return
+
+        update_fields = [
+            field.name
+            for field, value in loaded.items()
+            if getattr(instance, field.attname) != value
+        ]
+
+        if not update_fields:
+            return
+
+        update_fields += [
+            field.name
+            for field in self.model._meta.concrete_fields
+            if getattr(field, "auto_now", False)
+        ]
+
+        instance.save(update_fields=update_fields)
+
+    def resolve_bundle_relations(self, items):
+        """
+        Resolve the bundle's foreign keys and through targets, with one query
+        per related model.
+        """
+        values = {}
+
+        for key, attr, value in items:
+            if isinstance(value, models.Model) or value is None:
+                continue
+
+            if isinstance(attr.field, models.ForeignKey):
+                lookups = [value]
+            elif isinstance(attr.field, models.ManyToManyField) and has_through(attr):
+                target_key = attr.field.m2m_target_field_name()
+                lookups = [
+                    item.get(target_key) for item in value if isinstance(item, dict)
+                ]
+            else:
+                continue
+
+            keys = values.setdefault(attr.field.related_model, {})
+            keys.setdefault(key, set()).update(filter(is_lookup_value, lookups))
+
+        relations = {}
+
+        for keys in values.values():
+            lookups = set().union(*keys.values())
+            related = (
+                self.resolve_relations(next(iter(keys)), lookups) if lookups else {}
+            )
+            relations.update(dict.fromkeys(keys, related))
+
+        return relations
+
+    def resolve_relations(self, key, values):
+        """
+        Resolve many values for a relation with one query, values that don't
+        resolve are left out of the result.
+        """
         related_model = getattr(self.model, key).field.related_model
         lookup_field = getattr(getattr(related_model, "Api", ""), "lookup_field", "pk")
-        try:
-            value = related_model.objects.get(**{lookup_field: value})
-        except related_model.DoesNotExist as e:
-            raise ValueError from e
-        return value
+        field = (
+            related_model._meta.pk
+            if lookup_field == "pk"
+            else related_model._meta.get_field(lookup_field)
+        )
+        lookups = {}
+
+        for value in values:
+            try:
+                lookups[value] = field.to_python(value)
+            except (TypeError, ValidationError):
+                continue
+
+        queryset = related_model.objects.filter(
+            **{f"{field.name}__in": set(lookups.values())}
+        )
+        related = {getattr(item, field.attname): item for item in queryset}
+
+        return {
+            value: related[lookup]
+            for value, lookup in lookups.items()
+            if lookup in related
+        }
 
     def set_foreign_key(self, instance, key, value):
         try:
-            value = self.resolve_relation(key, value) if value is not None else None
-        except ValueError as e:
+            value = self.relations[key][value] if value is not None else None
+        except (KeyError, TypeError) as e:
             raise ValidationError(f"Invalid {self.keymap[key]}") from e
         setattr(instance, key, value)
 
     def set_many_to_many(self, instance, key, value):
-        related_manager = getattr(instance, key)
-        related_model = related_manager.model
+        """Add and remove only what differs from the current through rows."""
+        attr = getattr(self.model, key)
+        related_model = attr.field.related_model
         lookup_field = getattr(getattr(related_model, "Api", ""), "lookup_field", "pk")
+        source_name = attr.field.m2m_field_name()
+        target_name = attr.field.m2m_reverse_field_name()
+        target_attname = attr.through._meta.get_field(target_name).attname
         try:
-            if lookup_field != "pk":
-                items = related_model.objects.filter(**{f"{lookup_field}__in": value})
-                assert len(items) == len(value)
-                value = items
-            related_manager.set(value)
-        except (AssertionError, IntegrityError, ValueError) as e:
+            if lookup_field == "pk":
+                pks = {
+                    item.pk if isinstance(item, models.Model) else item
+                    for item in value
+                }
+                pks = set(map(related_model._meta.pk.to_python, pks))
+            else:
+                lookups = related_model.objects.filter(**{f"{lookup_field}__in": value})
+                pks = set(lookups.values_list("pk", flat=True))
+                assert len(pks) == len(set(value))
+            existing = set(
+                attr.through.objects.filter(**{source_name: instance}).values_list(
+                    target_attname, flat=True
+                )
+            )
+            related_manager = getattr(instance, key)
+            removed = existing - pks
+            added = pks - existing
+            if removed or added:
+                with transaction.atomic():
+                    related_manager.remove(*removed)
+                    related_manager.add(*added)
+        except (
+            AssertionError,
+            IntegrityError,
+            TypeError,
+            ValidationError,
+            ValueError,
+        ) as e:
             raise ValidationError(f"Invalid {self.keymap[key]}") from e
 
     def set_many_to_many_with_through(self, instance, key, value):
+        """
+        Write only the through rows that differ from the current ones. Rows are
+        written with the through model, rather than the related manager, so no
+        `m2m_changed` signals are sent, and they're bulk written unless the
+        through model overrides `save()`.
+        """
+        attr = getattr(self.model, key)
+        through_model = attr.through
+        source_name = attr.field.m2m_field_name()
+        target_name = attr.field.m2m_reverse_field_name()
+        target_key = attr.field.m2m_target_field_name()
+        target_attname = through_model._meta.get_field(target_name).attname
+
         try:
-            attr = getattr(self.model, key)
-            through_model = attr.through
-            model_name = self.model._meta.model_name
-            target_key = attr.field.m2m_target_field_name()
-            relation_name = attr.field.m2m_reverse_field_name()
+            pivots = {}
+
+            for item in value:
+                target = self.relations[key][item[target_key]]
+                pivot = {k: v for k, v in item.items() if k != target_key}
+                pivots[target.pk] = (target, pivot)
+
+                for name in pivot:
+                    through_model._meta.get_field(name)
+
+            existing = {
+                getattr(row, target_attname): row
+                for row in through_model.objects.filter(**{source_name: instance})
+            }
+            created = []
+            updated = []
+            update_fields = set()
+
+            for pk, (target, pivot) in pivots.items():
+                row = existing.pop(pk, None)
 
-            def pivot_data(item):
-                return {k: v for k, v in item.items() if k != target_key}
+                if row is None:
+                    lookup = {source_name: instance, target_name: target}
+                    created.append(through_model(**pivot, **lookup))
+                    continue
 
-            def target_lookup(item):
-                return {relation_name: self.resolve_relation(key, item[target_key])}
+                changed = {k for k, v in pivot.items() if getattr(row, k) != v}
 
-            def save_through(defaults, **kwargs):
-                return through_model.objects.update_or_create(defaults, **kwargs)[0]
+                for name in changed:
+                    setattr(row, name, pivot[name])
 
-            model_lookup = {model_name: instance}
+                if changed:
+                    updated.append(row)
+                    update_fields |= changed
 
-            items = [
-                save_through(pivot_data(item), **model_lookup, **target_lookup(item)).pk
-                for item in value
-            ]
+            self.write_through_rows(
+                through_model, existing, created, updated, update_fields
+            )
 
-            through_model.objects.filter(**model_lookup).exclude(pk__in=items).delete()
-        except (AttributeError, IntegrityError, ValueError) as e:
+            # the related managers would clear these, had they written the rows
+            source = through_model._meta.get_field(source_name)
+            prefetched = getattr(instance, "_prefetched_objects_cache", {})
+            prefetched.pop(key, None)
+            prefetched.pop(source.remote_field.get_cache_name(), None)
+        except (
+            FieldDoesNotExist,
+            IntegrityError,
+            KeyError,
+            TypeError,
+            ValueError,
+        ) as e:
             raise ValidationError(f"Invalid {self.keymap[key]}") from e
 
+    def write_through_rows(self, through_model, stale, created, updated, fields):
+        """Delete, create and update through rows, in bulk if `save()` allows."""
+        with transaction.atomic():
+            if stale:
+                pks = [row.pk for row in stale.values()]
+                through_model.objects.filter(pk__in=pks).delete()
+
+            if through_model.save is not models.Model.save:
+                for row in created + updated:
+                    row.save()
+                return
+
+            if created:
+                through_model.objects.bulk_create(created)
+
+            if updated:
+                through_model.objects.bulk_update(updated, sorted(fields))
+
     def validate(self):
         instance = self.get_instance()
 
@@ -104,7 +275,18 @@ class AssignAttributes:
                 raise ValidationError(f"Invalid {self.keymap[key]}")
 
             if field.unique:
-                other_records = self.model.objects.exclude(pk=instance.pk)
+                self.validate_unique(instance, key)
+
+    def validate_unique(self, instance, key):
+        other_records = self.model.objects.exclude(pk=instance.pk)
+
+        if other_records.filter(**{key: self.bundle[key]}).exists():
+            raise ValidationError(f"Field {self.keymap[key]} must be unique")
+
+
+def has_through(attr):
+    return not attr.through._meta.auto_created
+
 
-                if other_records.filter(**{key: self.bundle[key]}).exists():
-                    raise ValidationError(f"Field {self.keymap[key]} must be unique")
+def is_lookup_value(value):
+    return isinstance(value, (int, str)) and not isinstance(value, bool)
@@ -1,18 +1,34 @@
+import re
+from functools import lru_cache
+
 from worf.exceptions import NamingThingsError
 
+# Field names come from a small, fixed vocabulary (models, serializers and query
+# params) so conversions are memoized, the bound keeps junk keys from piling up.
+CACHE_SIZE = 2048
+
+CAMEL_UPPER = re.compile(r"[A-Z]")
+CAMEL_UPPER_SEQUENTIAL = re.compile(r"^[A-Z]|[A-Z]{2}")
+SNAKE_COMPONENT = re.compile(r"_([a-z])")
+
 
+@lru_cache(maxsize=CACHE_SIZE)
 def snake_to_camel(snake):
     invalid_msg = f"{snake} is not valid snake case. "
     if snake.lower() != snake:
         raise NamingThingsError(invalid_msg + "It has capital letters!")
 
-    components = snake.split("_")
-    if not "".join(x for x in components).isalpha():
+    if not snake.replace("_", "").isalpha():
         raise NamingThingsError(invalid_msg + "It has special chars!")
 
+    if snake.isascii() and "__" not in snake and not snake.endswith("_"):
+        return SNAKE_COMPONENT.sub(lambda match: match.group(1).upper(), snake)
+
+    components = snake.split("_")
     return components[0] + "".join(x.title() for x in components[1:])
 
 
+@lru_cache(maxsize=CACHE_SIZE)
 def camel_to_snake(camel):
     if camel.lower() == camel:
         return camel
@@ -22,6 +38,13 @@ def camel_to_snake(camel):
     if not camel.replace("__", "").isalpha():
         raise NamingThingsError(invalid_msg + "It has non alphabetical chars!")
 
+    if camel.isascii():
+        if CAMEL_UPPER_SEQUENTIAL.search(camel):
+            raise NamingThingsError(
+                invalid_msg + "It has multiple upper-case chars sequentially!"
+            )
+        return CAMEL_UPPER.sub(lambda match: "_" + match.group().lower(), camel)
+
     snake = ""
     last_was_upper = True
     for value in camel:
@@ -37,3 +60,15 @@ def camel_to_snake(camel):
         last_was_upper = value.isupper()
 
     return snake
+
+
+def cache_clear():
+    camel_to_snake.cache_clear()
+    snake_to_camel.cache_clear()
+
+
+def cache_info():
+    return dict(
+        camel_to_snake=camel_to_snake.cache_info(),
+        snake_to_camel=snake_to_camel.cache_info(),
+    )
@@ -0,0 +1,97 @@
+import json
+from functools import lru_cache
+from importlib import import_module
+
+from django.core.exceptions import ImproperlyConfigured
+from django.core.serializers.json import DjangoJSONEncoder
+
+from worf.conf import settings
+
+
+class JSONBackend:
+    module_name = "json"
+
+    def __init__(self):
+        self.module = import_module(self.module_name)
+        self.encoder = DjangoJSONEncoder()
+
+    def default(self, value):
+        return self.encoder.default(value)
+
+    def dumps(self, data, indent=None, compact=False):
+        separators = (",", ":") if compact and not indent else None
+        indent = indent or (None if compact else 0)
+        return json.dumps(
+            data, default=self.default, indent=indent, separators=separators
+        ).encode()
+
+    def loads(self, data):
+        return json.loads(data)
+
+
+class ORJSONBackend(JSONBackend):
+    """
+    Always compact. Dates and times are passed through to DjangoJSONEncoder, so
+    they're encoded the same as with the json backend.
+    """
+
+    module_name = "orjson"
+
+    def dumps(self, data, indent=None, compact=False):
+        option = self.module.OPT_NON_STR_KEYS | self.module.OPT_PASSTHROUGH_DATETIME
+        if indent:
+            option |= self.module.OPT_INDENT_2
+        return self.module.dumps(data, default=self.default, option=option)
+
+    def loads(self, data):
+        return self.module.loads(data)
+
+
+class UJSONBackend(JSONBackend):
+    """Decimals are encoded natively as numbers, rather than as strings."""
+
+    module_name = "ujson"
+
+    def dumps(self, data, indent=None, compact=False):
+        return self.module.dumps(
+            data,
+            default=self.default,
+            escape_forward_slashes=False,
+            indent=indent or 0,
+        ).encode()
+
+    def loads(self, data):
+        return self.module.loads(bytes(data))
+
+
+BACKENDS = {
+    "json": JSONBackend,
+    "orjson": ORJSONBackend,
+    "ujson": UJSONBackend,
+}
+
+
+def get_backend(name=None):
+    return load_backend(name or settings.WORF_JSON_BACKEND)
+
+
+@lru_cache(maxsize=None)
+def load_backend(name):
+    if name not in BACKENDS:
+        choices = ", ".join(BACKENDS)
+        raise ImproperlyConfigured(f"WORF_JSON_BACKEND must be one of: {choices}")
+
+    try:
+        return BACKENDS[name]()
+    except ImportError as e:
+        raise ImproperlyConfigured(f"WORF_JSON_BACKEND is {name}, install it") from e
+
+
+def dumps(data, indent=None, compact=None):
+    if compact is None:
+        compact = settings.WORF_JSON_COMPACT
+    return get_backend().dumps(data, indent=indent, compact=compact)
+
+
+def loads(data):
+    return get_backend().loads(data)
@@ -26,6 +26,11 @@ class NamingThingsError(WorfError, ValueError):
     message: str
 
 
+@dataclass(frozen=True)
+class ParseError(WorfError, ValueError):
+    message: str = "Invalid JSON"
+
+
 @dataclass(frozen=True)
 class NotFound(WorfError):
     message: str = "Not found"
@@ -1,13 +1,146 @@
-from urllib.parse import urlencode
+from collections import defaultdict
+from functools import lru_cache, reduce
 
-from url_filter.exceptions import SkipFilter
+from url_filter.constants import StrictMode
+from url_filter.exceptions import Empty, SkipFilter
+from url_filter.filters import MANY_LOOKUP_FIELD_OVERWRITES, CallableFilter, Filter
 from url_filter.filtersets import ModelFilterSet
+from url_filter.utils import FilterSpec, LookupConfig
 
+from django.core.exceptions import ValidationError
+from django.db.models.constants import LOOKUP_SEP
 from django.db.models.fields.related import ForeignObjectRel, RelatedField
 from django.http import QueryDict
 
+# Filter trees are built by introspecting the model and annotations, they're the
+# same for every request so they're built once per filterset class/annotation
+# signature, as are the filters and lookups that query string keys resolve to.
+# Trees are bound to a detached filterset when built and never rebound, so
+# they're only read while filtering.
+FILTERS = {}
+RESOLVED_FILTERS = {}
+
 
 class AnnotatedModelFilterSet(ModelFilterSet):
+    @property
+    def filters(self):
+        key = (type(self), get_annotation_signature(self.queryset))
+        filters = FILTERS.get(key)
+
+        if filters is None:
+            detached = type(self)(data=QueryDict(), queryset=self.queryset)
+            filters = FILTERS[key] = detached.build_filters()
+
+        return filters
+
+    def build_filters(self):
+        filters = self.get_filters()
+
+        for name, _filter in filters.items():
+            _filter.bind(name, self)
+
+        return filters
+
+    def get_specs(self):
+        """
+        Same as `FilterSet.get_specs`, except keys are resolved to a filter and
+        lookup once, rather than walking the filter tree for every value.
+        """
+        specs = []
+        errors = defaultdict(list)
+
+        for key, values in self.data.lists():
+            resolved = self.get_key_filter(key, errors)
+
+            if resolved is not None:
+                specs += self.get_value_specs(key, *resolved, values, errors)
+
+        self.check_spec_errors(errors)
+
+        return specs
+
+    def get_invalid_keys(self):
+        """
+        Keys that wouldn't be applied, because they don't resolve to a filter,
+        or one of their values doesn't clean, for callers that can't let a
+        filter be dropped silently.
+        """
+        errors = defaultdict(list)
+        invalid = set()
+
+        for key, values in self.data.lists():
+            resolved = self.get_key_filter(key, errors)
+
+            if resolved is None:
+                invalid.add(key)
+            else:
+                self.get_value_specs(key, *resolved, values, errors)
+
+        return invalid | set(errors)
+
+    def get_key_filter(self, key, errors):
+        """The filter and lookup for a key, or None if it's skipped or invalid."""
+        try:
+            self.validate_key(key)
+        except ValidationError:
+            return None
+
+        try:
+            return self.resolve_filter(key)
+        except SkipFilter:
+            return None
+        except ValidationError as e:
+            errors[key].extend(e.messages)
+            return None
+
+    def get_value_specs(self, key, _filter, lookup, values, errors):
+        specs = []
+
+        for value in values:
+            try:
+                if isinstance(_filter, CallableFilter):  # pragma: no cover
+                    spec = self.get_spec(get_lookup_config(key, value))
+                else:
+                    value = self.clean_value(_filter, value, lookup)
+                    spec = FilterSpec(_filter.components, lookup, value, "!" in key)
+            except ValidationError as e:
+                errors[key].extend(e.messages)
+            else:
+                specs.append(spec)
+
+        return specs
+
+    def clean_value(self, _filter, value, lookup):
+        """
+        Same as `Filter.clean_value`, except many lookups use this filterset's
+        strict mode, rather than the one the shared tree is bound to.
+        """
+        if lookup in MANY_LOOKUP_FIELD_OVERWRITES:
+            form_field = MANY_LOOKUP_FIELD_OVERWRITES[lookup](
+                child=_filter.form_field,
+                all_valid=self.strict_mode == StrictMode.fail,
+            )
+        else:
+            form_field = _filter.get_form_field(lookup)
+
+        return form_field.clean(value)
+
+    def check_spec_errors(self, errors):
+        if errors and self.strict_mode == StrictMode.fail:
+            raise ValidationError(dict(errors))
+        elif errors and self.strict_mode == StrictMode.empty:
+            raise Empty
+
+    def resolve_filter(self, key):
+        cache_key = (type(self), get_annotation_signature(self.queryset), key)
+        resolved = RESOLVED_FILTERS.get(cache_key)
+
+        if resolved is None:
+            parts = key.replace("!", "").split(LOOKUP_SEP)
+            resolved = RESOLVED_FILTERS[cache_key] = resolve_filter(self, parts)
+
+        return resolved
+
     def get_filters(self):
         filters = super().get_filters()
 
@@ -44,14 +177,98 @@ class AnnotatedModelFilterSet(ModelFilterSet):
 
 
 def generate_filterset(model, queryset):
+    return build_filterset(model, get_annotation_signature(queryset))
+
+
+@lru_cache(maxsize=None)
+def build_filterset(model, annotations):
     return type(
         f"{model.__name__}FilterSet",
         (AnnotatedModelFilterSet,),
-        dict(Meta=type("Meta", (), dict(model=model, queryset=queryset))),
+        dict(Meta=type("Meta", (), dict(model=model))),
+    )
+
+
+def get_annotation_signature(queryset):
+    """Annotation names and output field types, which decide the filter tree."""
+    if queryset is None:
+        return ()
+
+    return tuple(
+        (name, type(annotation.output_field))
+        for name, annotation in queryset.query.annotations.items()
+    )
+
+
+def joins_many(queryset):
+    """Whether any of the queryset's joins can duplicate rows."""
+    query = queryset.query
+
+    return any(
+        getattr(join, "join_field", None) is not None
+        and (join.join_field.one_to_many or join.join_field.many_to_many)
+        and query.alias_refcount[alias]
+        for alias, join in query.alias_map.items()
     )
 
 
 def apply_filterset(filter_set, queryset, lookup_kwargs):
-    data = QueryDict(urlencode(lookup_kwargs, True))
+    return filter_set(data=get_filter_data(lookup_kwargs), queryset=queryset).filter()
+
+
+def get_filter_data(lookup_kwargs):
+    """Build filter data from lookups directly, without a query string."""
+    data = QueryDict(mutable=True)
+
+    for key, value in lookup_kwargs.items():
+        values = value if isinstance(value, (list, tuple)) else [value]
+        data.setlist(key, [str(item) for item in values])
+
+    return data
+
+
+def get_lookup_config(key, value):  # pragma: no cover
+    parts = key.replace("!", "").split(LOOKUP_SEP)
+    return LookupConfig(key, reduce(lambda a, b: {b: a}, (parts + [value])[::-1]))
+
+
+def resolve_filter(node, parts):
+    """
+    Walk the filter tree to the filter and lookup a key's parts resolve to, the
+    same way `FilterSet.get_spec` and `Filter.get_spec` do, minus the value.
+    """
+    if isinstance(node, Filter):
+        if len(parts) > 1:
+            raise ValidationError(
+                "Invalid filtering data provided. "
+                "Data is more complex then expected. "
+                "Most likely additional lookup was specified "
+                "after the final lookup (e.g. field__in__equal=value)."
+            )
+
+        if parts and node.no_lookup:  # pragma: no cover
+            raise ValidationError(
+                "Lookup was explicit used in filter specification. "
+                "This filter does not allow to specify lookup."
+            )
+
+        lookup = parts[0] if parts else node.default_lookup
+
+        if lookup not in node.lookups:
+            raise ValidationError(f'"{lookup}" lookup is not supported')
+
+        return node, lookup
+
+    if parts:
+        name, parts = parts[0], parts[1:]
+    elif node.default_filter is None:  # pragma: no cover
+        raise SkipFilter
+    else:
+        name = node.default_filter.source
+
+    if name not in node.filters:
+        if node.default_filter and node is not node.root:
+            return resolve_filter(node.default_filter, [name, *parts])
+        raise SkipFilter
 
-    return filter_set(data=data, queryset=queryset).filter()
+    return resolve_filter(node.filters[name], parts)
@@ -1,15 +1,28 @@
+from worf.optimizers import only_loaded_fields
+
+
 class FindInstance:
     lookup_field = "id"
     lookup_url_kwarg = "id"
+    optimize_fields = True
     queryset = None
 
     def get_instance(self):
         if not hasattr(self, "instance"):
             self.lookup_kwargs = {self.lookup_field: self.kwargs[self.lookup_url_kwarg]}
-            self.instance = self.get_queryset().get(**self.lookup_kwargs)
+            self.instance = self.get_instance_queryset().get(**self.lookup_kwargs)
 
         return self.instance
 
+    def get_instance_queryset(self):
+        queryset = self.get_queryset()
+
+        if not self.optimize_fields or self.request.method != "GET":
+            return queryset
+
+        serializer = self.load_serializer()
+        return only_loaded_fields(queryset, serializer) if serializer else queryset
+
     def get_queryset(self):
         if self.queryset is None:
             return self.model.objects.all()
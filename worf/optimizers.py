@@ -0,0 +1,207 @@
+from functools import lru_cache
+
+from marshmallow import fields
+
+
+@lru_cache(maxsize=None)
+def get_model_fields(model):
+    """Model fields and reverse relations, keyed by their attribute name."""
+    return {
+        get_accessor_name(field): field
+        for field in model._meta.get_fields()
+        if get_accessor_name(field)
+    }
+
+
+def get_accessor_name(field):
+    if field.auto_created and not field.concrete:
+        return field.get_accessor_name()
+    return field.name
+
+
+def get_query_name(field):
+    if field.auto_created and not field.concrete:
+        return field.field.related_query_name()
+    return field.name
+
+
+def get_relations(model, serializer, select=((), ()), prefetch=(), classes=()):
+    """
+    Walk a serializer's dump fields, and work out the `select_related` paths
+    (forward and reverse one-to-one relations) and `prefetch_related` paths
+    (everything past a to-many relation) needed to dump a row without extra
+    queries. Attributes that aren't model relations end the walk for that path,
+    as do nested serializers that nest themselves, directly or not.
+    """
+    select_related = set()
+    prefetch_related = set()
+    classes = (*classes, type(serializer))
+
+    for name, field in serializer.dump_fields.items():
+        if isinstance(field, fields.List):
+            field = field.inner
+
+        related_model = model
+        query_path, attr_path = select
+        prefetch_path = prefetch
+
+        for part in (field.attribute or name).split("."):
+            model_field = get_model_fields(related_model).get(part)
+
+            if model_field is None or model_field.related_model is None:
+                break
+
+            related_model = model_field.related_model
+
+            if prefetch_path or model_field.many_to_many or model_field.one_to_many:
+                prefetch_path = (prefetch_path or attr_path) + (part,)
+                prefetch_related.add("__".join(prefetch_path))
+            else:
+                query_path += (get_query_name(model_field),)
+                attr_path += (part,)
+                select_related.add("__".join(query_path))
+        else:
+            if isinstance(field, fields.Nested) and type(field.schema) not in classes:
+                nested_select, nested_prefetch = get_relations(
+                    related_model,
+                    field.schema,
+                    (query_path, attr_path),
+                    prefetch_path,
+                    classes,
+                )
+                select_related |= nested_select
+                prefetch_related |= nested_prefetch
+
+    return select_related, prefetch_related
+
+
+def optimize_queryset(queryset, serializer):
+    """Apply the relations needed to dump `queryset` with `serializer`."""
+    select_related, prefetch_related = get_relations(queryset.model, serializer)
+
+    if select_related and queryset.query.select_related is not True:
+        queryset = queryset.select_related(*sorted(select_related))
+
+    prefetched = {
+        getattr(lookup, "prefetch_to", lookup)
+        for lookup in queryset._prefetch_related_lookups
+    }
+    prefetch_related -= prefetched
+
+    if prefetch_related:
+        queryset = queryset.prefetch_related(*sorted(prefetch_related))
+
+    return queryset
+
+
+def get_loaded_fields(model, serializer, select_related, annotations=()):
+    """
+    Work out the `.only()` paths needed to dump a row with `serializer`, or
+    `None` when a field could read anything, e.g. methods and properties.
+    """
+    loaded_fields = set()
+
+    for name, field in serializer.dump_fields.items():
+        if isinstance(field, fields.List):
+            field = field.inner
+
+        if isinstance(field, (fields.Function, fields.Method)):
+            return None
+
+        if not getattr(field, "_CHECK_ATTRIBUTE", True):
+            return None
+
+        parts = (field.attribute or name).split(".")
+
+        if parts[0] in annotations:
+            continue
+
+        paths = get_attribute_fields(model, parts, field, select_related)
+
+        if paths is None:
+            return None
+
+        loaded_fields |= paths
+
+    return loaded_fields
+
+
+def get_attribute_fields(model, parts, field, select_related):
+    part, *parts = parts
+    model_field = get_model_fields(model).get(part)
+
+    if model_field is None:
+        return None
+
+    if not model_field.is_relation:
+        return {part}
+
+    if model_field.related_model is None:  # pragma: no cover
+        return None
+
+    if model_field.many_to_many or model_field.one_to_many:
+        return set()
+
+    query_name = get_query_name(model_field)
+    local_fields = {query_name} if model_field.concrete else set()
+
+    if query_name not in select_related:
+        return local_fields
+
+    related_model = model_field.related_model
+    nested_select = select_related[query_name]
+
+    if parts:
+        paths = get_attribute_fields(related_model, parts, field, nested_select)
+    elif isinstance(field, fields.Nested):
+        paths = get_loaded_fields(related_model, field.schema, nested_select)
+    else:
+        paths = None
+
+    if paths is None:
+        return None
+
+    return local_fields | {f"{query_name}__{path}" for path in paths}
+
+
+def get_select_paths(model, select_related):
+    """The relation fields `select_related` needs loaded."""
+    for name, nested_select in select_related.items():
+        model_field = model._meta.get_field(name)
+
+        if model_field.concrete:
+            yield name
+
+        for path in get_select_paths(model_field.related_model, nested_select):
+            yield f"{name}__{path}"
+
+
+def only_loaded_fields(queryset, serializer, extra_fields=()):
+    """Restrict `queryset` to the columns `serializer` dumps, where possible."""
+    select_related = queryset.query.select_related
+
+    if select_related is True:
+        return queryset
+
+    annotations = queryset.query.annotations
+    select_related = select_related or {}
+    model = queryset.model
+    loaded_fields = get_loaded_fields(model, serializer, select_related, annotations)
+
+    if loaded_fields is None:
+        return queryset
+
+    for name in extra_fields:
+        if name in annotations or name == "pk":
+            continue
+
+        paths = get_attribute_fields(model, name.split("__"), None, select_related)
+
+        if paths is None:
+            return queryset
+
+        loaded_fields |= paths
+
+    loaded_fields |= set(get_select_paths(model, select_related))
+
+    return queryset.only(*sorted(loaded_fields))
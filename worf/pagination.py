@@ -0,0 +1,200 @@
+import json
+import operator
+from dataclasses import dataclass, field
+from datetime import date, datetime, time
+from decimal import Decimal
+from functools import reduce
+from hashlib import sha256
+from uuid import UUID
+
+from django.core import signing
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet, ImproperlyConfigured
+from django.db import connections
+from django.db.models import F, OrderBy, Q
+
+from worf.exceptions import FieldError
+
+
+class CursorSerializer:
+    """Signing serializer that keeps full precision for common ordering values."""
+
+    def default(self, value):
+        if isinstance(value, (date, datetime, time)):
+            return value.isoformat()
+        if isinstance(value, (Decimal, UUID)):
+            return str(value)
+        raise TypeError(f"Cannot use {type(value).__name__} in a cursor")
+
+    def dumps(self, obj):
+        return json.dumps(obj, default=self.default, separators=(",", ":")).encode()
+
+    def loads(self, data):
+        return json.loads(data.decode())
+
+
+@dataclass(frozen=True)
+class CursorPage:
+    object_list: list = field(default_factory=list)
+    next_cursor: str = None
+    previous_cursor: str = None
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+
+class CursorPaginator:
+    """
+    Keyset pagination, pages are fetched with a `WHERE` on the ordering values
+    of the last (or first) row seen, so deep pages cost the same as the first
+    and no count is needed.
+
+    Cursors are signed, so they're opaque to clients and can't be tampered with.
+    The primary key is appended to the ordering to break ties, ordering fields
+    should be non-nullable.
+    """
+
+    salt = "worf.pagination.cursor"
+
+    def __init__(self, queryset, per_page, ordering):
+        self.queryset = queryset
+        self.per_page = per_page
+        self.ordering = self.get_ordering(ordering)
+
+    def get_ordering(self, ordering):
+        model = self.queryset.model
+        pk_names = {"pk", model._meta.pk.name}
+        normalized = []
+
+        for item in ordering or model._meta.ordering:
+            if isinstance(item, str) and item != "?":
+                normalized.append((item.lstrip("-"), item.startswith("-")))
+            elif isinstance(item, OrderBy) and isinstance(item.expression, F):
+                normalized.append((item.expression.name, item.descending))
+            else:
+                message = f"Cursor pagination doesn't support ordering by {item}"
+                raise ImproperlyConfigured(message)
+
+        if not pk_names & {name for name, _ in normalized}:
+            normalized.append(("pk", False))
+
+        return normalized
+
+    def decode(self, cursor):
+        try:
+            values, reverse = signing.loads(
+                cursor, salt=self.salt, serializer=CursorSerializer
+            )
+            assert isinstance(values, list) and len(values) == len(self.ordering)
+        except (AssertionError, TypeError, ValueError, signing.BadSignature) as e:
+            raise FieldError("Invalid cursor") from e
+        return values, bool(reverse)
+
+    def encode(self, row, reverse=False):
+        values = [self.get_value(row, name) for name, _ in self.ordering]
+        return signing.dumps(
+            [values, reverse], salt=self.salt, serializer=CursorSerializer
+        )
+
+    def get_value(self, row, name):
+        return reduce(getattr, name.split("__"), row)
+
+    def get_keyset_filter(self, values, reverse):
+        filters = []
+        names = [name for name, _ in self.ordering]
+
+        for index, (name, descending) in enumerate(self.ordering):
+            lookup = "lt" if descending != reverse else "gt"
+            equal = dict(zip(names[:index], values))
+            filters.append(Q(**equal, **{f"{name}__{lookup}": values[index]}))
+
+        return reduce(operator.or_, filters)
+
+    def get_order_by(self, reverse):
+        return [
+            OrderBy(F(name), descending=descending != reverse)
+            for name, descending in self.ordering
+        ]
+
+    def page(self, cursor=None):
+        values, reverse = self.decode(cursor) if cursor else (None, False)
+
+        queryset = self.queryset.order_by(*self.get_order_by(reverse))
+
+        if values is not None:
+            queryset = queryset.filter(self.get_keyset_filter(values, reverse))
+
+        rows = list(queryset[: self.per_page + 1])
+        has_more = len(rows) > self.per_page
+        rows = rows[: self.per_page]
+
+        if reverse:
+            rows.reverse()
+
+        if not rows:
+            return CursorPage()
+
+        has_next = has_more if not reverse else True
+        has_previous = has_more if reverse else values is not None
+
+        return CursorPage(
+            rows,
+            next_cursor=self.encode(rows[-1]) if has_next else None,
+            previous_cursor=self.encode(rows[0], True) if has_previous else None,
+        )
+
+
+def cached_count(queryset, count, timeout, key_prefix="worf:count"):
+    """Cache a count function's result by the queryset's SQL and parameters."""
+    try:
+        sql = repr(queryset.query.sql_with_params())
+    except EmptyResultSet:
+        return 0
+
+    key = f"{key_prefix}:{sha256(sql.encode()).hexdigest()}"
+    result = cache.get(key)
+
+    if result is None:
+        result = count(queryset)
+        cache.set(key, result, timeout)
+
+    return result
+
+
+def estimate_count(queryset, limit=1000):
+    """
+    Count up to `limit` rows, past that the planner's row estimate is used on
+    PostgreSQL, other databases have no estimate so None is returned.
+    """
+    count = queryset[:limit].count()
+
+    if count < limit:
+        return count
+
+    estimate = planner_count(queryset)
+
+    return None if estimate is None else max(count, estimate)
+
+
+def planner_count(queryset):
+    connection = connections[queryset.db]
+
+    if connection.vendor != "postgresql":
+        return None
+
+    try:  # pragma: no cover
+        sql, params = queryset.query.sql_with_params()
+    except EmptyResultSet:  # pragma: no cover
+        return 0
+
+    with connection.cursor() as cursor:  # pragma: no cover
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+
+    if isinstance(plan, str):  # pragma: no cover
+        plan = json.loads(plan)
+
+    return int(plan[0]["Plan"]["Plan Rows"])  # pragma: no cover
@@ -0,0 +1,46 @@
+from django.core.exceptions import RequestDataTooBig
+
+from worf.conf import settings
+from worf.encoders import loads
+from worf.exceptions import ParseError
+
+CHUNK_SIZE = 64 * 1024
+
+
+def parse_json(request):
+    """
+    Decode a JSON request body, read in chunks so the upload limit is enforced
+    as the body comes in. The bytes are kept as `request.body`, as Django would,
+    so middleware and views can still read it.
+    """
+    if not hasattr(request, "_body"):
+        request._body = read_body(request, settings.DATA_UPLOAD_MAX_MEMORY_SIZE)
+
+    body = request._body
+
+    if not body:
+        return {}
+
+    try:
+        return loads(body)
+    except ValueError as e:
+        raise ParseError() from e
+
+
+def read_body(request, max_size=None, chunk_size=CHUNK_SIZE):
+    chunks = []
+    size = 0
+    message = "Request body exceeded settings.DATA_UPLOAD_MAX_MEMORY_SIZE."
+
+    if max_size is not None:
+        if int(request.META.get("CONTENT_LENGTH") or 0) > max_size:
+            raise RequestDataTooBig(message)
+
+    while chunk := request.read(chunk_size):
+        chunks.append(chunk)
+        size += len(chunk)
+
+        if max_size is not None and size > max_size:
+            raise RequestDataTooBig(message)
+
+    return b"".join(chunks)
@@ -1,14 +1,15 @@
-from django.http import HttpResponse, JsonResponse
+from django.http import HttpResponse
 from django.template.response import TemplateResponse
 
 from worf.casing import snake_to_camel
 from worf.conf import settings
+from worf.encoders import dumps
 from worf.shortcuts import field_list
 
 
 def browsable_response(request, response, status_code, view):
     template = "worf/api.html"
-    serializer = hasattr(view, "bundle") and view.get_serializer()
+    serializer = hasattr(view, "bundle") and view.load_serializer()
 
     bundle = getattr(view, "bundle", {})
     include = field_list(bundle.get("include", []))
@@ -50,6 +51,7 @@ def browsable_response(request, response, status_code, view):
         payload=bundle,
         response=response,
         serializer=serializer,
+        serializer_loads=getattr(view, "serializer_loads", None),
         serializer_name=type(serializer).__name__,
         settings=settings,
         view=view,
@@ -70,8 +72,17 @@ def render_response(request, data, status_code, view):
         and request.GET.get("format") != "json"
     )
 
+    if data != "" and not isinstance(data, dict):
+        raise TypeError(
+            "In order to allow non-dict objects to be serialized set the "
+            "safe parameter to False."
+        )
+
     response = (
-        JsonResponse(data, json_dumps_params=dict(indent=2 if is_browsable else 0))
+        HttpResponse(
+            dumps(data, indent=2 if is_browsable else None),
+            content_type="application/json",
+        )
         if data != ""
         else HttpResponse()
     )
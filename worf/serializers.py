@@ -1,6 +1,10 @@
+from copy import copy
+from datetime import datetime
+from functools import lru_cache
+
 import marshmallow
 from marshmallow.decorators import *  # noqa: F401, F403
-from marshmallow.utils import missing  # noqa: F401
+from marshmallow.utils import get_value, isoformat, missing
 
 from django.db.models.fields.files import FieldFile
 
@@ -10,6 +14,19 @@ from worf.conf import settings
 from worf.exceptions import FieldError
 from worf.shortcuts import field_list
 
+# Field types converted inline by compiled serializers, and the value types they
+# return unchanged.
+INLINE_TYPES = {
+    marshmallow.fields.Boolean: (bool,),
+    marshmallow.fields.Float: (float,),
+    marshmallow.fields.Integer: (int,),
+    marshmallow.fields.String: (str,),
+}
+
+# Bound serializers are cached as templates, each call gets a cheap copy of one
+# with its own context, so nothing request specific is shared or kept alive.
+CACHE_SIZE = 256
+
 
 class SerializeModels:
     include_fields = {}
@@ -33,7 +50,15 @@ class SerializeModels:
         if self.staff_serializer and self.request.user.is_staff:  # pragma: no cover
             serializer = self.staff_serializer
 
-        return serializer and serializer(**self.get_serializer_kwargs(**kwargs))
+        return serializer and self.bind_serializer(serializer, **kwargs)
+
+    def bind_serializer(self, serializer, **kwargs):
+        kwargs = self.get_serializer_kwargs(**kwargs)
+
+        if isinstance(serializer, type) and issubclass(serializer, Serializer):
+            return serializer.bound(**kwargs)
+
+        return serializer(**kwargs)
 
     def get_serializer_context(self):
         return {}
@@ -46,14 +71,36 @@ class SerializeModels:
         return dict(context=context, only=only, exclude=exclude)
 
     def load_serializer(self):
+        """
+        Resolve the serializer once per request, it's loaded for every key that's
+        validated, and again to respond, so it's reused until the method or the
+        bundle's `fields`/`include` change.
+        """
+        bundle = getattr(self, "bundle", {})
+        key = (self.request.method, bundle.get("fields"), bundle.get("include"))
+        memo = getattr(self, "_serializer_memo", None)
+
+        if memo and memo[0] is bundle and memo[1] == key:
+            self.count_serializer_load("hits")
+            return memo[2]
+
         try:
-            return self.get_serializer()
+            serializer = self.get_serializer()
         except ValueError as e:
             if str(e).startswith("Invalid fields"):
                 invalid_fields = str(e).partition(": ")[2].strip(".")
                 raise FieldError(f"Invalid fields: {invalid_fields}")
             raise e  # pragma: no cover
 
+        self.count_serializer_load("misses")
+        self._serializer_memo = (bundle, key, serializer)
+        return serializer
+
+    def count_serializer_load(self, outcome):
+        if settings.WORF_DEBUG:
+            loads = self.__dict__.setdefault("serializer_loads", dict(hits=0, misses=0))
+            loads[outcome] += 1
+
     def serialize(self):
         return self.load_serializer().dump(self.get_instance())
 
@@ -65,6 +112,8 @@ class SerializerOptions(marshmallow.SchemaOpts):
         defaults = settings.WORF_SERIALIZER_DEFAULT_OPTIONS
         defaults["ordered"] = defaults.get("ordered", True)
 
+        self.compiled = getattr(meta, "compiled", False)
+
         for key, value in defaults.items():
             setattr(self, key, getattr(meta, key, value))
 
@@ -110,7 +159,7 @@ class Serializer(marshmallow.Schema):
         elif kwargs.get("only"):
             only = kwargs.get("only")
 
-        return self.__class__(
+        return self.__class__.bound(
             context=kwargs.get("context", self.context),
             dump_only=kwargs.get("dump_only", self.dump_only),
             exclude=set(self.raw_exclude or []) | set(kwargs.get("exclude") or []),
@@ -130,12 +179,240 @@ class Serializer(marshmallow.Schema):
         )
         return f"<{name}({', '.join(f'{k}={v}' for k, v in kwargs.items() if v)})>"
 
+    @classmethod
+    def bound(
+        cls,
+        context=None,
+        dump_only=(),
+        exclude=(),
+        load_only=(),
+        many=False,
+        only=(),
+        partial=False,
+        unknown=None,
+    ):
+        """
+        Return a copy of a cached instance bound with the given options, fields
+        are copied rather than bound again, so binding and casing happen once.
+        """
+        template = bind(
+            cls,
+            only=frozenset(only or ()),
+            exclude=frozenset(exclude or ()),
+            dump_only=frozenset(dump_only or ()),
+            load_only=frozenset(load_only or ()),
+            many=many,
+            partial=partial if isinstance(partial, bool) else frozenset(partial),
+            unknown=unknown,
+        )
+        return clone(template, dict(context or {}))
+
     @property
     def dict_class(self):
         return dict
 
+    @property
+    def dump_builder(self):
+        builder = getattr(self, "_dump_builder", None)
+
+        # fields are re-initialized when nested serializers are copied
+        if builder is None or builder[0] is not self.dump_fields:
+            builder = self._dump_builder = (self.dump_fields, compile_dump(self))
+
+        return builder[1]
+
+    @property
+    def dump_plan(self):
+        plan = getattr(self, "_dump_plan", None)
+
+        if plan is None or plan[0] is not self.dump_fields:
+            dump = self.dump_builder(self, *self.dump_fields.values())
+            plan = self._dump_plan = (self.dump_fields, dump)
+
+        return plan[1]
+
     def on_bind_field(self, field_name, field_obj):
         field_obj.data_key = snake_to_camel(field_obj.data_key or field_name)
 
+    def _serialize(self, obj, *, many=False):
+        if not self.opts.compiled:
+            return super()._serialize(obj, many=many)
+
+        dump = self.dump_plan
+
+        if many and obj is not None:
+            return [dump(item) for item in obj]
+
+        return dump(obj)
+
     class Meta:
         ordered = True
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def bind(serializer_class, **kwargs):
+    return serializer_class(**kwargs)
+
+
+def cache_clear():
+    bind.cache_clear()
+
+
+def cache_info():
+    return bind.cache_info()
+
+
+def compile_dump(serializer):
+    """
+    Generate a builder for dump functions specialized for the serializer's
+    fields, it's called with a serializer and its dump fields, so copies of the
+    serializer share the generated code.
+
+    Plain attributes are read with getattr and common field types are converted
+    inline, anything else (custom fields, nested, methods) goes through the
+    field's own serialize, so the output matches marshmallow's dump exactly.
+    """
+    namespace = dict(
+        datetime=datetime,
+        fallback=marshmallow.Schema._serialize,
+        get_value=get_value,
+        missing=missing,
+    )
+    refs = [f"field_{index}" for index in range(len(serializer.dump_fields))]
+
+    lines = [
+        f"def build({', '.join(['serializer', *refs])}):",
+        "    accessor = serializer.get_attribute",
+        "    def dump(obj):",
+        "        if hasattr(obj, '__getitem__'):",
+        "            return fallback(serializer, obj)",
+        "        ret = {}",
+    ]
+
+    for index, (name, field) in enumerate(serializer.dump_fields.items()):
+        key = field.data_key if field.data_key is not None else name
+        ref = refs[index]
+        convert = compile_conversion(serializer, name, field, ref, namespace)
+
+        if convert is None:
+            lines += [
+                f"        value = {ref}.serialize({name!r}, obj, accessor)",
+                "        if value is not missing:",
+                f"            ret[{key!r}] = value",
+            ]
+            continue
+
+        attribute = field.attribute or name
+        getter = "get_value" if "." in attribute else "getattr"
+        lines.append(f"        value = {getter}(obj, {attribute!r}, missing)")
+
+        default = field.dump_default
+        indent = "        "
+        if default is missing:
+            lines.append("        if value is not missing:")
+            indent += "    "
+        else:
+            namespace[f"default_{index}"] = default
+            call = "()" if callable(default) else ""
+            lines.append(f"        if value is missing: value = default_{index}{call}")
+
+        lines.append(f"{indent}ret[{key!r}] = {convert}")
+
+    lines += [
+        "        return ret",
+        "    return dump",
+    ]
+
+    exec("\n".join(lines), namespace)  # noqa: S102
+
+    return namespace["build"]
+
+
+def compile_conversion(serializer, name, field, ref, namespace):
+    Field = marshmallow.fields.Field
+    kind = type(field)
+
+    if (
+        not field._CHECK_ATTRIBUTE
+        or kind.serialize is not Field.serialize
+        or kind.get_value is not Field.get_value
+        or type(serializer).get_attribute is not marshmallow.Schema.get_attribute
+        or getattr(field, "as_string", False)
+    ):
+        return None
+
+    if kind is marshmallow.fields.Inferred:
+        mapping = serializer.TYPE_MAPPING
+        types = {t for t, cls in mapping.items() if t in INLINE_TYPES.get(cls, ())}
+        types |= {type(None)} - set(mapping)
+        inline_datetime = mapping.get(datetime) is marshmallow.fields.DateTime
+        datetime_format = serializer.opts.datetimeformat
+    elif kind in INLINE_TYPES:
+        types = {type(None), *INLINE_TYPES[kind]}
+        inline_datetime = False
+    elif kind is marshmallow.fields.DateTime:
+        types = {type(None)}
+        inline_datetime = True
+        datetime_format = field.format
+    else:
+        return None
+
+    namespace[f"{ref}_types"] = frozenset(types)
+    convert = f"value if type(value) in {ref}_types else "
+
+    if inline_datetime and is_isoformat(datetime_format):
+        convert += "value.isoformat() if type(value) is datetime else "
+
+    return convert + f"{ref}._serialize(value, {name!r}, obj)"
+
+
+def is_isoformat(datetime_format):
+    funcs = marshmallow.fields.DateTime.SERIALIZATION_FUNCS
+    return funcs.get(datetime_format or "iso") is isoformat
+
+
+def clone(serializer, context, classes=()):
+    """
+    Copy a bound serializer with its own context. Fields are shallow copied and
+    re-parented to the copy, nested serializers are cloned the same way, except
+    self-referencing ones, which are left for marshmallow to build on use.
+    """
+    cloned = copy(serializer)
+    cloned.context = context
+    classes = (*classes, type(serializer))
+    fields = {
+        name: clone_field(field, cloned, context, classes)
+        for name, field in serializer.fields.items()
+    }
+    cloned.fields = fields
+    cloned.load_fields = {name: fields[name] for name in serializer.load_fields}
+    cloned.dump_fields = {name: fields[name] for name in serializer.dump_fields}
+    cloned._dump_plan = None
+
+    if getattr(serializer.opts, "compiled", False):
+        cloned._dump_builder = (cloned.dump_fields, serializer.dump_builder)
+
+    return cloned
+
+
+def clone_field(field, parent, context, classes):
+    cloned = copy(field)
+    cloned.parent = parent
+
+    if isinstance(field, marshmallow.fields.Nested):
+        schema = field.schema
+        cloned._schema = (
+            None if type(schema) in classes else clone(schema, context, classes)
+        )
+
+    for name in ("inner", "key_field", "value_field"):
+        inner = getattr(field, name, None)
+        if isinstance(inner, marshmallow.fields.Field):
+            setattr(cloned, name, clone_field(inner, cloned, context, classes))
+
+    if getattr(field, "tuple_fields", None):
+        cloned.tuple_fields = [
+            clone_field(inner, cloned, context, classes) for inner in field.tuple_fields
+        ]
+
+    return cloned
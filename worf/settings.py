@@ -9,6 +9,9 @@ WORF_BROWSABLE_API = getattr(settings, "WORF_BROWSABLE_API", True)
 
 WORF_DEBUG = getattr(settings, "WORF_DEBUG", settings.DEBUG)
 
+WORF_JSON_BACKEND = getattr(settings, "WORF_JSON_BACKEND", "json")
+WORF_JSON_COMPACT = getattr(settings, "WORF_JSON_COMPACT", False)
+
 WORF_SERIALIZER_DEFAULT_OPTIONS = getattr(
     settings, "WORF_SERIALIZER_DEFAULT_OPTIONS", {}
 )
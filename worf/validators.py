@@ -1,5 +1,8 @@
+from dataclasses import dataclass
 from datetime import datetime, time
 from decimal import Decimal, InvalidOperation
+from functools import lru_cache
+from typing import Callable
 from uuid import UUID
 
 from django.core.exceptions import ValidationError
@@ -8,6 +11,20 @@ from django.db import models
 from django.utils.dateparse import parse_datetime, parse_time
 
 from worf.conf import settings
+from worf.filters import get_annotation_signature
+
+# Validation plans resolve each field's validator once per view class/annotation
+# signature, rather than walking the field types for every key of every bundle.
+VALIDATION_PLANS = {}
+WRITE_METHODS = ("PATCH", "POST", "PUT")
+
+
+@dataclass(frozen=True)
+class FieldValidation:
+    field: object
+    coerce: Callable = None
+    allow_blank: bool = False
+    allow_null: bool = False
 
 
 class ValidateFields:
@@ -46,14 +63,14 @@ class ValidateFields:
         if not isinstance(value, str):
             return None
 
-        return datetime.strptime(value, "%Y-%m-%d")
+        return parse_iso_date(value)
 
     def _validate_datetime(self, key):
         value = self.bundle[key]
         coerced = None
 
         if isinstance(value, str):
-            coerced = parse_datetime(value)
+            coerced = parse_iso_datetime(value)
 
         if not isinstance(coerced, datetime):
             raise ValidationError(
@@ -67,7 +84,7 @@ class ValidateFields:
         coerced = None
 
         if isinstance(value, str):
-            coerced = parse_time(value)
+            coerced = parse_iso_time(value)
 
         if not isinstance(coerced, time):
             raise ValidationError(
@@ -84,6 +101,8 @@ class ValidateFields:
                 f"Field {self.keymap[key]} accepts an array, got {type(value)} {value}"
             )
 
+        return value
+
     def _validate_string(self, key, max_length):
         value = self.bundle[key]
 
@@ -170,113 +189,239 @@ class ValidateFields:
             raise ValidationError(f"{value} is not a valid email address")
         return email
 
-    def validate_bundle(self, key):  # noqa: C901
-        """
-        Handle basic type validation and coercion.
-
-        @param key: the model attribute to check against.
+    def get_validation_plan(self):
+        queryset = self.get_queryset() if hasattr(self, "get_queryset") else None
+        key = (type(self), get_annotation_signature(queryset))
+        plan = VALIDATION_PLANS.get(key)
 
-        @raise NotImplementedError: If the field type is not currently supported
-        @raise ValidationError: If this is a write and `key` is not serializer editable
-        @raise ValidationError: If a value fails to pass validation
+        if plan is None:
+            plan = VALIDATION_PLANS[key] = self.compile_validation_plan(queryset)
 
-        Side Effects:
-        As various bundle objects are parsed and validated, we reset the bundle.
-        This may result in self.bundle changes.
+        return plan
 
-        We expect to set a fully validated bundle keys and values.
+    def compile_validation_plan(self, queryset=None):
+        """
+        Map each model field, foreign key attname and queryset annotation to the
+        callable that coerces its bundle values, custom `validate_<key>` hooks
+        take priority.
         """
-        serializer = self.load_serializer()
-        write_fields = list(serializer.load_fields.keys())
-        write_methods = ("PATCH", "POST", "PUT")
-
-        if self.request.method in write_methods and key not in write_fields:
-            message = f"{self.keymap[key]} is not editable"
-            if settings.WORF_DEBUG:  # pragma: no cover
-                message += f":: {serializer}"
-            raise ValidationError(message)
-
-        annotation = (
-            self.get_queryset().query.annotations.get(key)
-            if hasattr(self, "get_queryset")
-            else None
+        annotations = queryset.query.annotations if queryset is not None else {}
+        fields = {
+            field.name: field
+            for field in self.model._meta.get_fields()
+            if hasattr(self.model, field.name)
+        }
+        fields.update(
+            (field.attname, field)
+            for field in self.model._meta.concrete_fields
+            if field.attname != field.name
         )
-
-        if key not in self.secure_fields and isinstance(self.bundle[key], str):
-            self.bundle[key] = self.bundle[key].replace("\x00", "").strip()
-
-        if not hasattr(self.model, key) and not annotation:  # pragma: no cover
-            raise ValidationError(f"{self.keymap[key]} does not exist")
-
-        field = (
-            annotation.output_field if annotation else self.model._meta.get_field(key)
+        fields.update(
+            (key, annotation.output_field) for key, annotation in annotations.items()
         )
+        return {
+            key: FieldValidation(
+                field=field,
+                coerce=self.get_coercer(key, field),
+                allow_blank=getattr(field, "blank", False)
+                and field.empty_strings_allowed,
+                allow_null=getattr(field, "null", False),
+            )
+            for key, field in fields.items()
+        }
 
-        if field.blank and field.empty_strings_allowed and self.bundle[key] == "":
-            return
-
-        elif field.null and self.bundle[key] is None:
-            return
+    def get_coercer(self, key, field):  # noqa: C901
+        hook = f"validate_{key}"
 
-        elif hasattr(self, f"validate_{key}"):
-            self.bundle[key] = getattr(self, f"validate_{key}")(self.bundle[key])
-            return
+        if hasattr(self, hook):
+            return lambda view, key: getattr(view, hook)(view.bundle[key])
 
         elif isinstance(field, models.UUIDField):
-            self.bundle[key] = self.validate_uuid(self.bundle[key])
-            return
+            return lambda view, key: view.validate_uuid(view.bundle[key])
 
         elif isinstance(field, models.EmailField):
-            self.bundle[key] = self.validate_email(self.bundle[key])
-            return
+            return lambda view, key: view.validate_email(view.bundle[key])
 
         elif isinstance(field, (models.CharField, models.TextField, models.SlugField)):
-            self.bundle[key] = self._validate_string(key, field.max_length)
-            return
+            return lambda view, key: view._validate_string(key, field.max_length)
 
         elif isinstance(field, models.PositiveIntegerField):
-            self.bundle[key] = self._validate_positive_int(key)
-            return
+            return type(self)._validate_positive_int
 
         elif isinstance(field, (models.IntegerField, models.SmallIntegerField)):
-            self.bundle[key] = self._validate_int(key)
-            return
+            return type(self)._validate_int
 
         elif isinstance(field, (models.DecimalField)):
-            self.bundle[key] = self._validate_decimal(key)
-            return
+            return type(self)._validate_decimal
 
         elif isinstance(field, models.BooleanField):
-            self.bundle[key] = self._validate_boolean(key)
-            return
+            return type(self)._validate_boolean
 
         elif isinstance(field, models.DateTimeField):
-            self.bundle[key] = self._validate_datetime(key)
-            return
+            return type(self)._validate_datetime
 
         elif isinstance(field, models.DateField):
-            self.bundle[key] = self._validate_date(key)
-            return
+            return type(self)._validate_date
 
         elif isinstance(field, models.TimeField):
-            self.bundle[key] = self._validate_time(key)
-            return
+            return type(self)._validate_time
 
         elif isinstance(field, models.ManyToManyField):
-            self._validate_many_to_many(key)
-            return
+            return type(self)._validate_many_to_many
 
         elif isinstance(field, models.FileField):
-            return  # Django will raise an exception if handled improperly
+            return None  # Django will raise an exception if handled improperly
 
         elif isinstance(field, models.ForeignKey):
-            return  # Django will raise an exception if handled improperly
+            return None  # Django will raise an exception if handled improperly
 
         elif isinstance(field, models.JSONField):
-            return  # Django will raise an exception if handled improperly
+            return None  # Django will raise an exception if handled improperly
 
         else:  # pragma: no cover
-            message = f"{field.get_internal_type()} has no validation method for {key}"
-            if settings.WORF_DEBUG:
-                message += f":: Received {self.bundle[key]}"
-            raise NotImplementedError(message)
+            return unsupported
+
+    def validate_bundle(self, key):
+        """
+        Handle basic type validation and coercion.
+
+        @param key: the model attribute to check against.
+
+        @raise NotImplementedError: If the field type is not currently supported
+        @raise ValidationError: If this is a write and `key` is not serializer editable
+        @raise ValidationError: If a value fails to pass validation
+
+        Side Effects:
+        As various bundle objects are parsed and validated, we reset the bundle.
+        This may result in self.bundle changes.
+
+        We expect to set a fully validated bundle keys and values.
+        """
+        self.coerce_bundle(key, self.get_field_validation(key))
+
+    def validate_bundles(self, bundles, keymaps):
+        """
+        Validate a list of bundles column by column, so each key's editable
+        check and plan lookup happen once for the whole list. Values are
+        coerced in place with `validate_bundle`, and every failure is returned
+        as `{index: {key: message}}`.
+        """
+        columns = {}
+        errors = {}
+
+        for index, bundle in enumerate(bundles):
+            for key in bundle:
+                columns.setdefault(key, []).append(index)
+
+        for key, rows in columns.items():
+            self.keymap = keymaps[rows[0]]
+
+            try:
+                validation = self.get_field_validation(key)
+            except ValidationError as e:
+                for index in rows:
+                    errors.setdefault(index, {})[key] = e.message
+                continue
+
+            for index in rows:
+                self.bundle = bundles[index]
+                self.keymap = keymaps[index]
+
+                try:
+                    self.validate_bundle(key)
+
+                    if self.bundle[key] is None and not validation.allow_null:
+                        raise ValidationError(f"Invalid {self.keymap[key]}")
+                except ValidationError as e:
+                    errors.setdefault(index, {})[key] = e.message
+
+        return dict(sorted(errors.items()))
+
+    def get_field_validation(self, key):
+        if self.request.method in WRITE_METHODS:
+            serializer = self.load_serializer()
+
+            if key not in serializer.load_fields:
+                message = f"{self.keymap[key]} is not editable"
+                if settings.WORF_DEBUG:  # pragma: no cover
+                    message += f":: {serializer}"
+                raise ValidationError(message)
+
+        validation = self.get_validation_plan().get(key)
+
+        if validation is None:  # pragma: no cover
+            raise ValidationError(f"{self.keymap[key]} does not exist")
+
+        return validation
+
+    def coerce_bundle(self, key, validation):
+        value = self.bundle[key]
+
+        if key not in self.secure_fields and isinstance(value, str):
+            value = self.bundle[key] = value.replace("\x00", "").strip()
+
+        if validation.allow_blank and value == "":
+            return
+
+        if validation.allow_null and value is None:
+            return
+
+        if validation.coerce:
+            self.bundle[key] = validation.coerce(self, key)
+
+
+def unsupported(view, key):  # pragma: no cover
+    field = view.get_validation_plan()[key].field
+    message = f"{field.get_internal_type()} has no validation method for {key}"
+    if settings.WORF_DEBUG:
+        message += f":: Received {view.bundle[key]}"
+    raise NotImplementedError(message)
+
+
+# Devices tend to send the same few timestamps over and over, and the parsed
+# values are immutable, so they're safe to share between requests.
+@lru_cache(maxsize=1024)
+def parse_iso_date(value):
+    """Parse `YYYY-MM-DD` with `fromisoformat`, falling back to `strptime`."""
+    if len(value) == 10 and value[4] == value[7] == "-":
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            pass
+
+    return datetime.strptime(value, "%Y-%m-%d")
+
+
+@lru_cache(maxsize=1024)
+def parse_iso_datetime(value):
+    """
+    Parse an ISO 8601 datetime with `fromisoformat`, accepting a `Z` suffix,
+    other shapes fall back to Django's `parse_datetime`.
+    """
+    if len(value) >= 16 and value[4] == value[7] == "-" and value[10] in "T ":
+        try:
+            return datetime.fromisoformat(
+                f"{value[:-1]}+00:00" if value[-1] == "Z" else value
+            )
+        except ValueError:
+            pass
+
+    return parse_datetime(value)
+
+
+@lru_cache(maxsize=1024)
+def parse_iso_time(value):
+    """
+    Parse an `HH:MM[:SS[.ffffff]]` time with `fromisoformat`, other shapes and
+    offsets fall back to Django's `parse_time`.
+    """
+    if len(value) > 4 and value[2] == ":":
+        try:
+            coerced = time.fromisoformat(value)
+        except ValueError:
+            coerced = None
+
+        if coerced is not None and coerced.tzinfo is None:
+            return coerced
+
+    return parse_time(value)
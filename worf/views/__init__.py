@@ -1,8 +1,10 @@
 from worf.views.action import ActionAPI  # noqa: F401
 from worf.views.base import AbstractBaseAPI, APIResponse  # noqa: F401
+from worf.views.bulk import BulkCreateAPI, BulkDeleteAPI, BulkUpdateAPI  # noqa: F401
 from worf.views.create import CreateAPI  # noqa: F401
 from worf.views.delete import DeleteAPI  # noqa: F401
 from worf.views.detail import DetailAPI, DetailUpdateAPI  # noqa: F401
 from worf.views.errors import NotFound  # noqa: F401
+from worf.views.export import ExportAPI  # noqa: F401
 from worf.views.list import ListAPI, ListCreateAPI  # noqa: F401
 from worf.views.update import UpdateAPI  # noqa: F401
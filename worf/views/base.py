@@ -1,5 +1,5 @@
-import json
 import warnings
+from dataclasses import dataclass
 from io import BytesIO
 from urllib.parse import parse_qs
 
@@ -9,6 +9,7 @@ from django.core.exceptions import (
     RequestDataTooBig,
     ValidationError,
 )
+from django.db.models import prefetch_related_objects
 from django.template.defaultfilters import filesizeformat
 from django.utils.decorators import method_decorator
 from django.views import View
@@ -22,12 +23,26 @@ from worf.exceptions import (
     DataConflict,
     FieldError,
     NotFound,
+    ParseError,
     WorfError,
 )
+from worf.optimizers import get_loaded_fields, get_relations
+from worf.parsers import parse_json
 from worf.renderers import render_response
 from worf.serializers import SerializeModels
 from worf.validators import ValidateFields
 
+# View configuration is checked and compiled once per class, rather than every
+# time Django instantiates the view for a request.
+VIEWS = {}
+
+
+@dataclass(frozen=True)
+class ViewConfig:
+    codepath: str
+    handlers: frozenset
+    filter_set: type = None
+
 
 @method_decorator(never_cache, name="dispatch")
 class APIResponse(View):
@@ -54,17 +69,48 @@ class AbstractBaseAPI(SerializeModels, ValidateFields, APIResponse):
     model = None
     permissions = []
     payload_key = None
+    refresh_fields = None
+    view_config = None
 
     def __init__(self, *args, **kwargs):
-        self.codepath = f"{self.__module__}.{self.__class__.__name__}"
+        super().__init__(*args, **kwargs)
+
+        # views configured through kwargs can't share the class config
+        if self.view_config is None:
+            self.view_config = self.compile() if kwargs else self.get_view_config()
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        # compiled once on startup, so errors raise early, and handed to every
+        # instance the view creates
+        if initkwargs.get("view_config") is None:
+            initkwargs["view_config"] = cls(**initkwargs).view_config
+        return super().as_view(**initkwargs)
+
+    def get_view_config(self):
+        config = VIEWS.get(type(self))
+
+        if config is None:
+            config = VIEWS[type(self)] = self.compile()
 
+        return config
+
+    def compile(self):
+        """Check the view's configuration, and resolve what doesn't vary per request."""
         if not isinstance(self.permissions, list):  # pragma: no cover
             raise ImproperlyConfigured(
                 f"{self.codepath}.permissions must be type: list"
             )
 
+        handlers = {
+            method for method in self.http_method_names if hasattr(self, method)
+        }
+
+        if "get" in handlers:
+            handlers.add("head")
+
         for method in ["post", "patch", "put", "delete"]:
-            if method in dir(self) and not len(self.permissions):
+            if method in handlers and not len(self.permissions):
                 warnings.warn(
                     "\n{} method allowed on {} without permissions.".format(
                         method.upper(),
@@ -72,7 +118,7 @@ class AbstractBaseAPI(SerializeModels, ValidateFields, APIResponse):
                     ),
                 )
 
-        super().__init__(*args, **kwargs)
+        return ViewConfig(codepath=self.codepath, handlers=frozenset(handlers))
 
     @property
     def name(self):
@@ -94,6 +140,8 @@ class AbstractBaseAPI(SerializeModels, ValidateFields, APIResponse):
             response = self.render_error(e.message, 400)
         except NotFound as e:
             response = self.render_error(e.message, 404)
+        except ParseError as e:
+            response = self.render_error(e.message, 400)
         except ValidationError as e:
             response = self.render_error(e.message, 422)
         return response
@@ -131,13 +179,56 @@ class AbstractBaseAPI(SerializeModels, ValidateFields, APIResponse):
     def get_handler(self, request, *args, **kwargs):
         method = request.method.lower()
         handler = self.http_method_not_allowed
-        if method in self.http_method_names:
+        if method in self.view_config.handlers:
             handler = getattr(self, method, self.http_method_not_allowed)
         return handler
 
     def get_instance(self):
         return self.instance if hasattr(self, "instance") else None
 
+    def refresh_instance(self, instance):
+        """
+        Reload the fields the response dumps after a write, the database may
+        have changed them and bundle values aren't always of the field's type.
+        To-many relations it dumps are prefetched again, rather than read per
+        row, including any the queryset already prefetched.
+        """
+        serializer = self.load_serializer()
+
+        if not serializer:
+            return
+
+        fields = self.get_refresh_fields(serializer)
+
+        if fields is None:
+            instance.refresh_from_db()
+        elif fields:
+            instance.refresh_from_db(fields=sorted(fields))
+
+        _, prefetch_related = get_relations(self.model, serializer)
+        prefetched = getattr(instance, "_prefetched_objects_cache", {})
+
+        for lookup in prefetch_related:
+            prefetched.pop(lookup.split("__")[0], None)
+
+        prefetch_related_objects([instance], *sorted(prefetch_related))
+
+    def get_refresh_fields(self, serializer):
+        if self.refresh_fields is not None and not self.refresh_fields:
+            return set()
+
+        loaded_fields = get_loaded_fields(self.model, serializer, {})
+
+        if loaded_fields is None:
+            return None if self.refresh_fields is None else set(self.refresh_fields)
+
+        dumped_fields = {path.split("__")[0] for path in loaded_fields}
+
+        if self.refresh_fields is None:
+            return dumped_fields
+
+        return dumped_fields & set(self.refresh_fields)
+
     def flatten_bundle(self, raw_bundle):
         # parse_qs gives us a dictionary where all values are lists
         return {
@@ -193,10 +284,18 @@ class AbstractBaseAPI(SerializeModels, ValidateFields, APIResponse):
             post, files = self.get_parts(request)
             raw_bundle.update(self.flatten_bundle(post))
             raw_bundle.update(self.flatten_bundle(files))
-        elif request.body:
-            try:
-                raw_bundle = json.loads(request.body)
-            except json.decoder.JSONDecodeError:
-                pass
+        else:
+            raw_bundle = parse_json(request)
+
+        if isinstance(raw_bundle, list):
+            self.set_bundles(raw_bundle)
+            return
+
+        if not isinstance(raw_bundle, dict):
+            raise ParseError("Invalid JSON, expected an object")
 
         self.set_bundle(raw_bundle)
+
+    def set_bundles(self, raw_bundles):
+        """Bulk views accept a list of bundles, everything else expects one."""
+        raise ParseError("Invalid JSON, expected an object")
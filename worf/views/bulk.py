@@ -0,0 +1,598 @@
+from dataclasses import dataclass, field
+
+from url_filter.constants import StrictMode
+
+from django.core.exceptions import (
+    FieldDoesNotExist,
+    ImproperlyConfigured,
+    ValidationError,
+)
+from django.db import IntegrityError, models, transaction
+
+from worf.assigns import AssignAttributes, is_lookup_value
+from worf.casing import snake_to_camel
+from worf.exceptions import DataConflict, FieldError, ParseError
+from worf.filters import get_filter_data
+from worf.optimizers import optimize_queryset
+from worf.views.base import AbstractBaseAPI
+from worf.views.create import CreateAPI
+
+
+@dataclass
+class BulkItem:
+    index: int
+    instance: models.Model
+    bundle: dict
+    keymap: dict
+    fields: set = field(default_factory=set)
+    many_to_many: set = field(default_factory=set)
+    rows: list = field(default_factory=list)
+
+
+class BulkAPI(AssignAttributes, AbstractBaseAPI):
+    """
+    Shared handling for views that accept a JSON array of bundles. Every item is
+    validated before anything is written, unique checks and relation lookups
+    run once per field for the whole batch rather than once per item.
+    """
+
+    bulk_batch_size = 500
+    bulk_max_items = 1000
+    bundles = None
+    validate_per_item = False
+
+    def bulk_response(self, items, status_code):
+        serializer = self.load_serializer()
+        instances = self.get_bulk_results([item.instance for item in items])
+        result = {str(self.name): serializer(many=True).dump(instances)}
+        return self.render_to_response(result, status_code)
+
+    def bulk_validate(self):
+        items = []
+        errors = []
+
+        for index, bundle in enumerate(self.bundles):
+            try:
+                if not isinstance(bundle, dict):
+                    raise ValidationError("Invalid item, expected an object")
+                self.set_bundle(bundle)
+                instance = self.get_bulk_instance()
+            except ValidationError as e:
+                errors.append(dict(index=index, message=e.message))
+            else:
+                items.append(BulkItem(index, instance, self.bundle, self.keymap))
+
+        if self.validate_per_item:
+            invalid = self.validate_items(items)
+        else:
+            invalid = self.validate_bundles(
+                [item.bundle for item in items], [item.keymap for item in items]
+            )
+
+        for position, messages in invalid.items():
+            index = items[position].index
+            errors += [
+                dict(index=index, message=message) for message in messages.values()
+            ]
+
+        items = [item for position, item in enumerate(items) if position not in invalid]
+        errors += self.check_unique(items)
+
+        if not errors:
+            relations = self.resolve_bulk_relations(items)
+
+            for item in items:
+                try:
+                    self.assign_bundle(item, relations)
+                except ValidationError as e:
+                    errors.append(dict(index=item.index, message=e.message))
+
+        if errors:
+            errors.sort(key=lambda error: error["index"])
+            raise BulkValidationError(dict(message="Invalid items", errors=errors))
+
+        return items
+
+    def validate_items(self, items):
+        """Run `validate()` for each item, returning the failures."""
+        errors = {}
+
+        for position, item in enumerate(items):
+            self.bundle = item.bundle
+            self.keymap = item.keymap
+            self.instance = item.instance
+
+            try:
+                self.validate()
+            except ValidationError as e:
+                errors[position] = {None: e.message}
+
+        return errors
+
+    def check_max_items(self):
+        if len(self.bundles) > self.bulk_max_items:
+            message = f"Bulk requests accept a maximum of {self.bulk_max_items} items"
+            raise ValidationError(message)
+
+    def get_bulk_instance(self):
+        raise NotImplementedError
+
+    def validate_unique(self, instance, key):
+        """Unique fields are checked for the whole batch, by `check_unique`."""
+
+    def check_unique(self, items):
+        """Check unique fields with one query per field, duplicates included."""
+        values = {}
+        errors = []
+
+        for item in items:
+            for key, value in item.bundle.items():
+                field = self.get_bulk_field(key)
+
+                if field is None or not field.unique or not is_lookup_value(value):
+                    continue
+
+                try:
+                    value = field.to_python(value)
+                except ValidationError:
+                    continue
+
+                values.setdefault(key, []).append((item, value))
+
+        for key, entries in values.items():
+            lookup = {f"{key}__in": {value for _, value in entries}}
+            taken = dict(
+                self.model._default_manager.filter(**lookup).values_list(key, "pk")
+            )
+
+            seen = set()
+
+            for item, value in entries:
+                if (
+                    value in seen
+                    or taken.get(value, item.instance.pk) != item.instance.pk
+                ):
+                    message = f"Field {item.keymap[key]} must be unique"
+                    errors.append(dict(index=item.index, message=message))
+                seen.add(value)
+
+        return errors
+
+    def get_bulk_field(self, key):
+        """The model field a bundle key sets, or None for annotations."""
+        try:
+            return self.model._meta.get_field(key)
+        except FieldDoesNotExist:
+            return None
+
+    def resolve_bulk_relations(self, items):
+        """Resolve every relation value in the request, with one query per field."""
+        values = {}
+
+        for item in items:
+            for key, value in item.bundle.items():
+                field = self.get_bulk_field(key)
+
+                if (
+                    not field
+                    or not field.is_relation
+                    or isinstance(value, models.Model)
+                ):
+                    continue
+
+                if field.many_to_many:
+                    target_key = field.m2m_target_field_name()
+                    value = [
+                        entry.get(target_key) if isinstance(entry, dict) else entry
+                        for entry in value
+                    ]
+                else:
+                    value = [value]
+
+                values.setdefault(key, set()).update(filter(is_lookup_value, value))
+
+        return {
+            key: self.resolve_relations(key, value) for key, value in values.items()
+        }
+
+    def assign_bundle(self, item, relations):
+        """Set the bundle on the item's instance, and build its through rows."""
+        instance = item.instance
+
+        for key, value in item.bundle.items():
+            field = self.get_bulk_field(key)
+
+            if field is None:
+                continue
+
+            if field.many_to_many:
+                item.many_to_many.add(field)
+                item.rows += self.get_through_rows(item, field, value, relations)
+                continue
+
+            if field.is_relation and not isinstance(value, models.Model):
+                resolved = is_lookup_value(value) and value in relations[key]
+                if value is not None and not resolved:
+                    raise ValidationError(f"Invalid {item.keymap[key]}")
+                value = relations[key].get(value)
+
+            current = getattr(instance, field.attname)
+            setattr(instance, key, value)
+
+            if instance._state.adding or getattr(instance, field.attname) != current:
+                item.fields.add(field.name)
+
+    def get_through_rows(self, item, field, value, relations):
+        through_model = field.remote_field.through
+        source_name = field.m2m_field_name()
+        target_name = field.m2m_reverse_field_name()
+        target_key = field.m2m_target_field_name()
+        related = relations[field.name]
+        invalid = ValidationError(f"Invalid {item.keymap[field.name]}")
+        targets = set()
+        rows = []
+
+        for entry in value:
+            pivot = dict(entry) if isinstance(entry, dict) else {}
+            target = pivot.pop(target_key, entry)
+
+            if not is_lookup_value(target) or target not in related:
+                raise invalid
+
+            target = related[target]
+
+            if target.pk in targets:
+                continue
+
+            targets.add(target.pk)
+
+            try:
+                row = through_model(**pivot)
+                row.clean_fields(exclude=[source_name, target_name])
+            except (TypeError, ValueError, ValidationError) as e:
+                raise invalid from e
+
+            setattr(row, source_name, item.instance)
+            setattr(row, target_name, target)
+            rows.append((row, set(pivot)))
+
+        return rows
+
+    def save_through_rows(self, items):
+        rows = {}
+
+        for item in items:
+            for row, _ in item.rows:
+                rows.setdefault(type(row), []).append(row)
+
+        for through_model, through_rows in rows.items():
+            through_model._default_manager.bulk_create(
+                through_rows, batch_size=self.bulk_batch_size
+            )
+
+    def get_bulk_results(self, instances):
+        queryset = self.model._default_manager.all()
+        serializer = self.load_serializer()
+
+        if serializer:
+            queryset = optimize_queryset(queryset, serializer)
+
+        results = queryset.in_bulk([instance.pk for instance in instances])
+        return [results[instance.pk] for instance in instances]
+
+
+class BulkCreateAPI(BulkAPI, CreateAPI):
+    """
+    POST a JSON array to create many objects at once. Rows are inserted with
+    `bulk_create`, and many-to-many through rows with one `bulk_create` per
+    relation, in a single transaction. Like `bulk_create`, this skips `save()`
+    and model signals.
+    """
+
+    def set_bundles(self, raw_bundles):
+        if self.request.method != "POST":
+            return super().set_bundles(raw_bundles)
+
+        self.bundles = raw_bundles
+        self.set_bundle({})
+
+    def post(self, *args, **kwargs):
+        if self.bundles is None:
+            return super().post(*args, **kwargs)
+
+        try:
+            items = self.bulk_create()
+        except BulkValidationError as e:
+            return self.render_to_response(e.payload, 422)
+
+        return self.bulk_response(items, 201)
+
+    def bulk_create(self):
+        self.check_max_items()
+
+        items = self.bulk_validate()
+        instances = [item.instance for item in items]
+
+        try:
+            with transaction.atomic():
+                self.model._default_manager.bulk_create(
+                    instances, batch_size=self.bulk_batch_size
+                )
+
+                if any(instance.pk is None for instance in instances):
+                    message = f"{self.codepath} needs a database that returns ids "
+                    message += "from bulk inserts, e.g. PostgreSQL or SQLite 3.35+"
+                    raise ImproperlyConfigured(message)  # pragma: no cover
+
+                self.save_through_rows(items)
+        except IntegrityError as e:
+            raise DataConflict() from e
+
+        return items
+
+    def get_bulk_instance(self):
+        if self.request.method != "POST":
+            return super().get_bulk_instance()
+        return self.new_instance()
+
+
+class BulkUpdateAPI(BulkAPI):
+    """
+    PATCH a JSON array of `{"id": ..., ...changes}` to update many objects at
+    once. Targets are fetched with one `in_bulk` query, and saved with one
+    `bulk_update` per set of changed fields, so `save()` and model signals are
+    skipped. Many-to-many fields are diffed, as they are by `UpdateAPI`.
+    """
+
+    bulk_lookup_field = "id"
+    update_serializer = None
+
+    def get_serializer(self, **kwargs):
+        if self.update_serializer and self.request.method == "PATCH":
+            return self.bind_serializer(self.update_serializer, **kwargs)
+        return super().get_serializer(**kwargs)
+
+    def set_bundles(self, raw_bundles):
+        if self.request.method != "PATCH":
+            return super().set_bundles(raw_bundles)
+
+        self.bundles = raw_bundles
+        self.set_bundle({})
+
+    def patch(self, *args, **kwargs):
+        if self.bundles is None:
+            raise ParseError("Invalid JSON, expected an array")
+
+        try:
+            items = self.bulk_update()
+        except BulkValidationError as e:
+            return self.render_to_response(e.payload, 422)
+
+        return self.bulk_response(items, 200)
+
+    def bulk_update(self):
+        self.check_max_items()
+
+        self.bulk_instances = self.get_bulk_instances()
+        self.bulk_seen = set()
+
+        items = self.bulk_validate()
+        auto_now = [
+            field
+            for field in self.model._meta.concrete_fields
+            if getattr(field, "auto_now", False)
+        ]
+        updates = {}
+
+        for item in items:
+            if not item.fields:
+                continue
+
+            for auto_field in auto_now:
+                auto_field.pre_save(item.instance, add=False)
+                item.fields.add(auto_field.name)
+
+            updates.setdefault(frozenset(item.fields), []).append(item.instance)
+
+        try:
+            with transaction.atomic():
+                for fields, instances in updates.items():
+                    self.model._default_manager.bulk_update(
+                        instances, sorted(fields), batch_size=self.bulk_batch_size
+                    )
+
+                self.update_through_rows(items)
+        except IntegrityError as e:
+            raise DataConflict() from e
+
+        return items
+
+    def get_bulk_instances(self):
+        """Fetch every object the request refers to, keyed by its lookup value."""
+        field = self.model._meta.get_field(self.bulk_lookup_field)
+        key = snake_to_camel(self.bulk_lookup_field)
+        queryset = (
+            self.get_queryset()
+            if hasattr(self, "get_queryset")
+            else self.model._default_manager.all()
+        )
+        lookups = set()
+
+        for bundle in self.bundles:
+            value = bundle.get(key) if isinstance(bundle, dict) else None
+            lookup = self.get_bulk_lookup(field, value)
+
+            if lookup is not None:
+                lookups.add(lookup)
+
+        return queryset.in_bulk(lookups, field_name=field.name)
+
+    def get_bulk_lookup(self, field, value):
+        """The lookup value converted to the field's type, so `"1"` matches `1`."""
+        if not is_lookup_value(value):
+            return None
+
+        try:
+            return field.to_python(value)
+        except ValidationError:
+            return None
+
+    def get_bulk_instance(self):
+        if self.request.method != "PATCH":
+            return super().get_bulk_instance()
+
+        field = self.model._meta.get_field(self.bulk_lookup_field)
+        value = self.bundle.pop(self.bulk_lookup_field, None)
+        key = self.keymap.pop(self.bulk_lookup_field, self.bulk_lookup_field)
+        lookup = self.get_bulk_lookup(field, value)
+
+        if lookup is None or lookup not in self.bulk_instances:
+            raise ValidationError(f"Invalid {key}")
+
+        if lookup in self.bulk_seen:
+            raise ValidationError(f"Duplicate {key}")
+
+        self.bulk_seen.add(lookup)
+        return self.bulk_instances[lookup]
+
+    def update_through_rows(self, items):
+        """
+        Diff the sent through rows against the current ones, with one query per
+        relation, only rows that differ are deleted, inserted or updated.
+        """
+        relations = {}
+
+        for item in items:
+            for m2m_field in item.many_to_many:
+                relations.setdefault(m2m_field, []).append(item)
+
+        for m2m_field, relation_items in relations.items():
+            through_model = m2m_field.remote_field.through
+            source = through_model._meta.get_field(m2m_field.m2m_field_name())
+            target = through_model._meta.get_field(m2m_field.m2m_reverse_field_name())
+            lookup = {f"{source.name}__in": [item.instance for item in relation_items]}
+            existing = {
+                (getattr(row, source.attname), getattr(row, target.attname)): row
+                for row in through_model._default_manager.filter(**lookup)
+            }
+            rows = [
+                row
+                for item in relation_items
+                for row in item.rows
+                if type(row[0]) is through_model
+            ]
+            created, updated, update_fields = self.diff_through_rows(
+                rows, existing, source, target
+            )
+
+            if existing:
+                stale = [row.pk for row in existing.values()]
+                through_model._default_manager.filter(pk__in=stale).delete()
+            if created:
+                through_model._default_manager.bulk_create(
+                    created, batch_size=self.bulk_batch_size
+                )
+            if updated:
+                through_model._default_manager.bulk_update(
+                    updated, sorted(update_fields), batch_size=self.bulk_batch_size
+                )
+
+    def diff_through_rows(self, rows, existing, source, target):
+        """
+        Split sent rows into new rows and changed current rows, matches are
+        popped from `existing`, which leaves the stale rows behind.
+        """
+        created = []
+        updated = []
+        update_fields = set()
+
+        for row, pivot in rows:
+            key = (getattr(row, source.attname), getattr(row, target.attname))
+            current = existing.pop(key, None)
+
+            if current is None:
+                created.append(row)
+                continue
+
+            changed = {
+                name for name in pivot if getattr(current, name) != getattr(row, name)
+            }
+
+            for name in changed:
+                setattr(current, name, getattr(row, name))
+
+            if changed:
+                updated.append(current)
+                update_fields |= changed
+
+        return created, updated, update_fields
+
+
+class BulkDeleteAPI:
+    """
+    DELETE the results of a `ListAPI`, filtered by the query string as they'd
+    be for a GET, pass `?dryRun=true` to count them instead. Rows are deleted by
+    primary key in batches inside a transaction, the queryset `delete()` only
+    loads instances when signals or cascades need them.
+    """
+
+    bulk_batch_size = 500
+    bulk_max_items = 1000
+
+    def set_bundle_from_request(self, request):
+        if request.method == "DELETE":
+            self.set_bundle_from_query_string(request)
+            return
+
+        super().set_bundle_from_request(request)
+
+    def delete(self, *args, **kwargs):
+        queryset = self.get_processed_queryset()
+
+        if not self.lookup_kwargs and not self.search_query:
+            raise FieldError("Bulk delete requires a filter")
+
+        self.check_filters()
+
+        pks = queryset.order_by().values_list("pk", flat=True)
+
+        if self.bundle.get("dry_run") is True:
+            return self.render_to_response(dict(count=pks.count()))
+
+        pks = list(pks[: self.bulk_max_items + 1])
+
+        if len(pks) > self.bulk_max_items:
+            message = f"Bulk delete matches more than {self.bulk_max_items} items"
+            raise ValidationError(message)
+
+        return self.render_to_response(dict(count=self.bulk_delete(pks)))
+
+    def check_filters(self):
+        """Make sure every filter is applied, rather than dropped by the filterset."""
+        lookups = self.lookup_kwargs.items()
+        filter_set = (self.filter_set or self.view_config.filter_set)(
+            data=get_filter_data({k: v for k, v in lookups if not isinstance(v, list)}),
+            queryset=self.get_queryset(),
+            strict_mode=StrictMode.fail,
+        )
+        invalid = filter_set.get_invalid_keys()
+
+        if invalid:
+            raise FieldError(f"Invalid filters: {invalid}")
+
+    def bulk_delete(self, pks):
+        count = 0
+
+        with transaction.atomic():
+            for index in range(0, len(pks), self.bulk_batch_size):
+                batch = pks[index : index + self.bulk_batch_size]
+                _, deleted = self.model._default_manager.filter(pk__in=batch).delete()
+                count += deleted.get(self.model._meta.label, 0)
+
+        return count
+
+
+class BulkValidationError(Exception):
+    def __init__(self, payload):
+        super().__init__(payload["message"])
+        self.payload = payload
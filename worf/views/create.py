@@ -9,12 +9,12 @@ class CreateAPI(AssignAttributes, AbstractBaseAPI):
         self.instance = self.new_instance()
         self.validate()
         self.save(self.instance, self.bundle)
-        self.instance.refresh_from_db()
+        self.refresh_instance(self.instance)
         return self.instance
 
     def get_serializer(self, **kwargs):
         if self.create_serializer and self.request.method == "POST":
-            return self.create_serializer(**self.get_serializer_kwargs(**kwargs))
+            return self.bind_serializer(self.create_serializer, **kwargs)
         return super().get_serializer(**kwargs)
 
     def new_instance(self):
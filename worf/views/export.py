@@ -0,0 +1,94 @@
+from itertools import islice
+
+import django
+from django.http import StreamingHttpResponse
+
+from worf.encoders import dumps
+from worf.pagination import CursorPaginator
+
+
+class ExportAPI:
+    """
+    Stream every result of a ListAPI, unpaginated, via `?format=ndjson` or
+    `?format=json-stream`. Rows are read with `.iterator()` and serialized in
+    chunks, so memory stays flat regardless of the number of rows.
+
+    Before Django 4.1 `.iterator()` ignores `prefetch_related`, so querysets that
+    prefetch are read a chunk at a time by keyset instead, which keeps the
+    prefetching, the ordering gets the primary key as a tie breaker.
+    """
+
+    export_chunk_size = 1000
+    export_content_types = {
+        "json-stream": "application/json",
+        "ndjson": "application/x-ndjson",
+    }
+
+    def get(self, *args, **kwargs):
+        export_format = self.request.GET.get("format")
+
+        if export_format in self.export_content_types:
+            return self.export_response(export_format)
+
+        return super().get(*args, **kwargs)
+
+    def export_chunks(self, queryset, serializer):
+        if django.VERSION < (4, 1) and queryset._prefetch_related_lookups:
+            yield from self.export_keyset_chunks(queryset, serializer)
+            return
+
+        rows = queryset.iterator(chunk_size=self.export_chunk_size)
+
+        while chunk := list(islice(rows, self.export_chunk_size)):
+            yield serializer.dump(chunk)
+
+    def export_keyset_chunks(self, queryset, serializer):
+        size = self.export_chunk_size
+        paginator = CursorPaginator(queryset, size, self.get_ordering())
+        queryset = queryset.order_by(*paginator.get_order_by(reverse=False))
+        chunk = list(queryset[:size])
+
+        while chunk:
+            yield serializer.dump(chunk)
+
+            if len(chunk) < size:
+                break
+
+            values = [
+                paginator.get_value(chunk[-1], name) for name, _ in paginator.ordering
+            ]
+            keyset = paginator.get_keyset_filter(values, reverse=False)
+            chunk = list(queryset.filter(keyset)[:size])
+
+    def export_ndjson(self, chunks):
+        for chunk in chunks:
+            yield b"".join(self.export_dumps(item) + b"\n" for item in chunk)
+
+    def export_json_stream(self, chunks):
+        delimiter = b""
+
+        yield b"{" + self.export_dumps(str(self.name)) + b":["
+
+        for chunk in chunks:
+            for item in chunk:
+                yield delimiter + self.export_dumps(item)
+                delimiter = b","
+
+        yield b"]}"
+
+    def export_dumps(self, value):
+        return dumps(value, compact=True)
+
+    def export_response(self, export_format):
+        # resolve everything that can fail up front, once streaming starts
+        # errors can no longer become a proper error response
+        serializer = self.load_serializer()(many=True)
+        queryset = self.get_processed_queryset()
+
+        chunks = self.export_chunks(queryset, serializer)
+        stream = getattr(self, f"export_{export_format.replace('-', '_')}")
+
+        return StreamingHttpResponse(
+            stream(chunks),
+            content_type=self.export_content_types[export_format],
+        )
@@ -1,5 +1,6 @@
 import operator
-from functools import reduce
+from dataclasses import replace
+from functools import partial, reduce
 
 from django.core.exceptions import ImproperlyConfigured
 from django.core.paginator import EmptyPage, Paginator
@@ -7,7 +8,9 @@ from django.db.models import F, OrderBy, Prefetch, Q
 
 from worf.casing import camel_to_snake
 from worf.exceptions import FieldError
-from worf.filters import apply_filterset, generate_filterset
+from worf.filters import apply_filterset, generate_filterset, joins_many
+from worf.optimizers import only_loaded_fields, optimize_queryset
+from worf.pagination import CursorPaginator, cached_count, estimate_count
 from worf.shortcuts import field_list, string_list
 from worf.views.base import AbstractBaseAPI
 from worf.views.create import CreateAPI
@@ -27,11 +30,19 @@ class ListAPI(AbstractBaseAPI):
     per_page = 25
     max_per_page = None
     num_pages = 1
-
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-
-        codepath = self.codepath
+    count_cache_timeout = None
+    count_limit = 1000
+    count_mode = "exact"
+    count_modes = [None, "estimate", "exact"]
+    cursor_pagination = False
+    next_cursor = None
+    optimize_fields = True
+    optimize_relations = True
+    previous_cursor = None
+
+    def compile(self):
+        config = super().compile()
+        codepath = config.codepath
 
         if not isinstance(self.ordering, list):  # pragma: no cover
             raise ImproperlyConfigured(f"{codepath}.ordering must be a list")
@@ -49,8 +60,9 @@ class ListAPI(AbstractBaseAPI):
             raise ImproperlyConfigured(f"{codepath}.sort_fields must be a list")
 
         # generate a default filterset if a custom one was not provided
-        if self.filter_set is None:
-            self.filter_set = generate_filterset(self.model, self.queryset)
+        filter_set = self.filter_set or generate_filterset(self.model, self.queryset)
+
+        return replace(config, filter_set=filter_set)
 
     def get(self, *args, **kwargs):
         return self.render_to_response()
@@ -128,11 +140,11 @@ class ListAPI(AbstractBaseAPI):
         list_kwargs = {k: v for k, v in lookups if isinstance(v, list)}
         ordering = self.get_ordering()
 
-        queryset = (
-            apply_filterset(self.filter_set, self.get_queryset(), filterset_kwargs)
-            .filter(self.search_query)
-            .distinct()
-        )
+        queryset = apply_filterset(
+            self.filter_set or self.view_config.filter_set,
+            self.get_queryset(),
+            filterset_kwargs,
+        ).filter(self.search_query)
 
         for key, value in list_kwargs.items():
             for item in value:
@@ -142,6 +154,10 @@ class ListAPI(AbstractBaseAPI):
                     else queryset.filter(**{key: item})
                 )
 
+        # to-many joins can duplicate rows, everything else is distinct already
+        if joins_many(queryset):
+            queryset = queryset.distinct()
+
         include_fields = self.get_processed_includes()
         if include_fields and self.bundle.get("include"):
             include = field_list(self.bundle["include"])
@@ -151,11 +167,27 @@ class ListAPI(AbstractBaseAPI):
                 elif isinstance(include_fields[item], str):
                     queryset = queryset.select_related(include_fields[item])
 
+        serializer = self.load_serializer()
+
+        if serializer and self.optimize_relations:
+            queryset = optimize_queryset(queryset, serializer)
+
+        if serializer and self.optimize_fields and self.request.method == "GET":
+            loaded_ordering = self.get_loaded_ordering(queryset, ordering)
+            queryset = only_loaded_fields(queryset, serializer, loaded_ordering)
+
         if ordering:
             queryset = queryset.order_by(*ordering)
 
         return queryset
 
+    def get_loaded_ordering(self, queryset, ordering):
+        """Fields cursors are built from, these are read off the rows."""
+        if not self.cursor_pagination:
+            return []
+        paginator = CursorPaginator(queryset, self.per_page, ordering)
+        return [name for name, _ in paginator.ordering]
+
     def get_ordering(self):
         ordering = []
 
@@ -170,33 +202,97 @@ class ListAPI(AbstractBaseAPI):
     def get_sort_field(self, field, descending=False):
         return OrderBy(F(field), descending=descending)
 
+    def get_per_page(self):
+        default_per_page = getattr(self, "results_per_page", self.per_page)
+        per_page = max(int(self.request.GET.get("perPage") or default_per_page), 1)
+        max_per_page = self.max_per_page or default_per_page
+        return min(per_page, max_per_page)
+
+    def get_count(self, queryset, count_mode):
+        count = (
+            partial(estimate_count, limit=self.count_limit)
+            if count_mode == "estimate"
+            else operator.methodcaller("count")
+        )
+
+        if self.count_cache_timeout:
+            key_prefix = f"worf:count:{self.codepath}:{count_mode}"
+            return cached_count(queryset, count, self.count_cache_timeout, key_prefix)
+
+        return count(queryset)
+
+    def get_count_mode(self):
+        """
+        Clients can skip (`?count=false`) or estimate (`?count=estimate`) the
+        count, but can't ask for anything more expensive than `count_mode`.
+        """
+        count_mode = self.bundle.get("count", self.count_mode)
+
+        if count_mode is True:
+            count_mode = self.count_mode
+        elif count_mode is False:
+            count_mode = None
+
+        if count_mode not in self.count_modes:
+            raise FieldError(f"Invalid count: {count_mode}")
+
+        index = self.count_modes.index
+        return min(count_mode, self.count_mode, key=index)
+
     def paginated_results(self):
         queryset = self.get_processed_queryset()
         request = self.request
 
-        default_per_page = getattr(self, "results_per_page", self.per_page)
-        per_page = max(int(request.GET.get("perPage") or default_per_page), 1)
-        max_per_page = self.max_per_page or default_per_page
-        paginator = Paginator(queryset, min(per_page, max_per_page))
+        if self.cursor_pagination:
+            return self.cursor_paginated_results(queryset)
+
+        count_mode = self.get_count_mode()
+        paginator = Paginator(queryset, self.get_per_page())
 
         self.page_num = int(request.GET.get("page") or request.GET.get("p") or 1)
         if self.page_num < 1:
             self.page_num = 1
 
-        self.num_pages = paginator.num_pages
-        self.count = paginator.count
+        count = None if count_mode is None else self.get_count(queryset, count_mode)
+
+        if count is None:
+            self.count = self.num_pages = None
+        else:
+            paginator.count = count
+            self.num_pages = paginator.num_pages
+            self.count = paginator.count
+
+        if count_mode != "exact":
+            bottom = (self.page_num - 1) * paginator.per_page
+            return queryset[bottom : bottom + paginator.per_page]
 
         try:
             return paginator.page(self.page_num)
         except EmptyPage:
             return []
 
+    def cursor_paginated_results(self, queryset):
+        paginator = CursorPaginator(queryset, self.get_per_page(), self.get_ordering())
+        page = paginator.page(self.request.GET.get("cursor"))
+
+        self.next_cursor = page.next_cursor
+        self.previous_cursor = page.previous_cursor
+
+        return page
+
     def serialize(self):
         serializer = self.load_serializer()
 
         payload = {str(self.name): serializer(many=True).dump(self.paginated_results())}
 
-        if self.per_page:
+        if self.per_page and self.cursor_pagination:
+            payload["pagination"] = dict(
+                next=self.next_cursor,
+                previous=self.previous_cursor,
+            )
+        elif self.per_page and self.count is None:
+            payload["pagination"] = dict(page=self.page_num)
+        elif self.per_page:
             payload["pagination"] = dict(
                 count=self.count,
                 pages=self.num_pages,
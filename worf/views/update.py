@@ -8,7 +8,7 @@ class UpdateAPI(AssignAttributes, FindInstance, AbstractBaseAPI):
 
     def get_serializer(self, **kwargs):
         if self.update_serializer and self.request.method in ("PATCH", "PUT"):
-            return self.update_serializer(**self.get_serializer_kwargs(**kwargs))
+            return self.bind_serializer(self.update_serializer, **kwargs)
         return super().get_serializer(**kwargs)
 
     def patch(self, *args, **kwargs):
@@ -23,5 +23,5 @@ class UpdateAPI(AssignAttributes, FindInstance, AbstractBaseAPI):
         instance = self.get_instance()
         self.validate()
         self.save(instance, self.bundle)
-        instance.refresh_from_db()
+        self.refresh_instance(instance)
         return instance